@@ -4,12 +4,17 @@ import json
 import re
 
 import logging
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional, Union
 from uuid import UUID, uuid4, uuid5, NAMESPACE_DNS
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status, Header
-from sqlalchemy import text
+from fastapi.responses import Response
+from sqlalchemy import Select, delete, func, insert, lambda_stmt, text
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 import httpx
 from sqlmodel import Session, select
 
@@ -28,7 +33,6 @@ from ..models import (
     RecipeCollectionItem,
     UsageMonthly,
     ImportUsageMonthly,
-    UsageEvent,
 )
 from ..schemas import (
     IngredientDTO,
@@ -41,6 +45,8 @@ from ..schemas import (
     ShoppingListSyncDTO,
     RecipeCollectionDTO,
     RecipeCollectionsSyncDTO,
+    SHOPPING_LIST_ADAPTER,
+    RECIPE_COLLECTION_LIST_ADAPTER,
 )
 from ..services import import_instagram as instagram_service
 from ..services import import_scan as scan_service
@@ -50,6 +56,7 @@ from ..services import import_youtube as youtube_service
 from ..services import import_web as web_service
 from ..services.import_utils import get_openai_client
 from ..services.import_cache import import_with_cache, detect_language
+from ..usage_queue import usage_event_queue
 
 
 _SETTINGS = get_settings()
@@ -64,7 +71,9 @@ class ImportRequest(BaseModel):
 
 
 class ImportResponse(BaseModel):
-    recipe: Union[RecipeReadDTO, Dict[str, Any]]
+    # Importers always hand back plain dicts; checking that branch first avoids a
+    # failed RecipeReadDTO validation on every response.
+    recipe: Union[Dict[str, Any], RecipeReadDTO] = Field(union_mode="left_to_right")
     videoPath: Optional[str] = None
     globalRecipeId: Optional[UUID] = None
     languageCode: Optional[str] = None
@@ -365,7 +374,8 @@ class RecipeFinderResponse(BaseModel):
 
 
 def _recipe_to_dto(recipe: Recipe) -> RecipeReadDTO:
-    return RecipeReadDTO(
+    # Rows were validated on the way in; skip re-validating them on every read.
+    return RecipeReadDTO.model_construct(
         id=recipe.id,
         title=recipe.title,
         description=recipe.description,
@@ -388,8 +398,14 @@ def _recipe_to_dto(recipe: Recipe) -> RecipeReadDTO:
         media_image_url=recipe.media_image_url,
         media_local_path=recipe.media_local_path,
         is_favorite=recipe.is_favorite,
-        ingredients=[IngredientDTO.model_validate(ing) for ing in recipe.ingredients],
-        instructions=[InstructionStepDTO.model_validate(step) for step in recipe.instructions],
+        ingredients=[
+            IngredientDTO.model_construct(id=ing.id, line=ing.line, amount=ing.amount, name=ing.name)
+            for ing in recipe.ingredients
+        ],
+        instructions=[
+            InstructionStepDTO.model_construct(id=step.id, step_number=step.step_number, text=step.text)
+            for step in recipe.instructions
+        ],
         tags=[tag.name for tag in recipe.tags],
     )
 
@@ -522,8 +538,11 @@ def _format_finder_catalog(recipes: List[RecipeFinderCandidate]) -> str:
     return "\n\n".join(entries)
 
 
+NON_ALNUM_PATTERN = re.compile(r"[^\w\s]")
+
+
 def _normalize_text(value: str) -> str:
-    return re.sub(r"[^a-z0-9\s]", " ", value.lower())
+    return NON_ALNUM_PATTERN.sub(" ", value.lower())
 
 
 def _extract_time_target(question: str) -> Optional[int]:
@@ -923,6 +942,29 @@ def _delete_user_data(session: Session, user_id: UUID) -> None:
     session.commit()
 
 
+def _import_response(recipe: Dict[str, Any], **fields: Any) -> Response:
+    # Importer payloads are already JSON-shaped dicts: skip the response_model
+    # re-validation and serialize once in pydantic-core.
+    body = ImportResponse.model_construct(recipe=recipe, **fields).model_dump_json()
+    return Response(content=body, media_type="application/json")
+
+
+def _has_import_data(recipe_data: Dict[str, Any]) -> bool:
+    ingredients = recipe_data.get("ingredients") or []
+    instructions = recipe_data.get("instructions") or []
+    return bool(ingredients or instructions)
+
+
+def _extract_usage_events(recipe_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    metadata = recipe_data.get("metadata") if isinstance(recipe_data, dict) else None
+    if not isinstance(metadata, dict):
+        return []
+    events = metadata.get("usageEvents")
+    if not isinstance(events, list):
+        return []
+    return [event for event in events if isinstance(event, dict)]
+
+
 @router.get("/users/me/settings", response_model=UserSettingsReadDTO)
 def get_user_settings(session: Session = Depends(get_db_session)) -> UserSettingsReadDTO:
     settings = _get_or_create_user_settings(session, DEFAULT_USER_ID)
@@ -1033,7 +1075,6 @@ def create_recipe(
         if source in manual_sources:
             owner_id = _resolve_user_id(x_user_email, x_user_id)
             _log_usage_events(
-                session,
                 owner_id,
                 request_id=uuid4(),
                 event_type="manual_add",
@@ -1103,7 +1144,7 @@ def import_web(
     x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
     x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
     session: Session = Depends(get_db_session),
-) -> ImportResponse:
+) -> Response:
     request_id = uuid4()
     try:
         recipe_data, _, global_recipe, cache_hit, language_code = import_with_cache(
@@ -1121,7 +1162,6 @@ def import_web(
         owner_id = _resolve_user_id(x_user_email, x_user_id)
         if has_data:
             _log_usage_events(
-                session,
                 owner_id,
                 request_id=request_id,
                 event_type="import",
@@ -1129,7 +1169,7 @@ def import_web(
                 events=_extract_usage_events(recipe_data),
                 import_credits_used=1 if has_data else 0,
             )
-    return ImportResponse(
+    return _import_response(
         recipe=recipe_data,
         globalRecipeId=global_recipe.id if global_recipe else None,
         languageCode=language_code,
@@ -1143,7 +1183,7 @@ def import_tiktok(
     x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
     x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
     session: Session = Depends(get_db_session),
-) -> ImportResponse:
+) -> Response:
     request_id = uuid4()
     try:
         recipe_data, video_path, global_recipe, cache_hit, language_code = import_with_cache(
@@ -1159,7 +1199,6 @@ def import_tiktok(
         owner_id = _resolve_user_id(x_user_email, x_user_id)
         if has_data:
             _log_usage_events(
-                session,
                 owner_id,
                 request_id=request_id,
                 event_type="import",
@@ -1167,7 +1206,7 @@ def import_tiktok(
                 events=_extract_usage_events(recipe_data),
                 import_credits_used=1 if has_data else 0,
             )
-    return ImportResponse(
+    return _import_response(
         recipe=recipe_data,
         videoPath=video_path,
         globalRecipeId=global_recipe.id if global_recipe else None,
@@ -1182,7 +1221,7 @@ def import_instagram(
     x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
     x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
     session: Session = Depends(get_db_session),
-) -> ImportResponse:
+) -> Response:
     request_id = uuid4()
     try:
         recipe_data, video_path, global_recipe, cache_hit, language_code = import_with_cache(
@@ -1198,7 +1237,6 @@ def import_instagram(
         owner_id = _resolve_user_id(x_user_email, x_user_id)
         if has_data:
             _log_usage_events(
-                session,
                 owner_id,
                 request_id=request_id,
                 event_type="import",
@@ -1206,7 +1244,7 @@ def import_instagram(
                 events=_extract_usage_events(recipe_data),
                 import_credits_used=1 if has_data else 0,
             )
-    return ImportResponse(
+    return _import_response(
         recipe=recipe_data,
         videoPath=video_path,
         globalRecipeId=global_recipe.id if global_recipe else None,
@@ -1221,7 +1259,7 @@ def import_pinterest(
     x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
     x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
     session: Session = Depends(get_db_session),
-) -> ImportResponse:
+) -> Response:
     request_id = uuid4()
     try:
         recipe_data, _, global_recipe, cache_hit, language_code = import_with_cache(
@@ -1239,7 +1277,6 @@ def import_pinterest(
         owner_id = _resolve_user_id(x_user_email, x_user_id)
         if has_data:
             _log_usage_events(
-                session,
                 owner_id,
                 request_id=request_id,
                 event_type="import",
@@ -1247,7 +1284,7 @@ def import_pinterest(
                 events=_extract_usage_events(recipe_data),
                 import_credits_used=1 if has_data else 0,
             )
-    return ImportResponse(
+    return _import_response(
         recipe=recipe_data,
         globalRecipeId=global_recipe.id if global_recipe else None,
         languageCode=language_code,
@@ -1261,7 +1298,7 @@ def import_youtube(
     x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
     x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
     session: Session = Depends(get_db_session),
-) -> ImportResponse:
+) -> Response:
     request_id = uuid4()
     try:
         recipe_data, _, global_recipe, cache_hit, language_code = import_with_cache(
@@ -1279,7 +1316,6 @@ def import_youtube(
         owner_id = _resolve_user_id(x_user_email, x_user_id)
         if has_data:
             _log_usage_events(
-                session,
                 owner_id,
                 request_id=request_id,
                 event_type="import",
@@ -1287,7 +1323,7 @@ def import_youtube(
                 events=_extract_usage_events(recipe_data),
                 import_credits_used=1 if has_data else 0,
             )
-    return ImportResponse(
+    return _import_response(
         recipe=recipe_data,
         globalRecipeId=global_recipe.id if global_recipe else None,
         languageCode=language_code,
@@ -1302,7 +1338,7 @@ async def import_scan(
     x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
     x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
     session: Session = Depends(get_db_session),
-) -> ImportResponse:
+) -> Response:
     request_id = uuid4()
     uploads: List[UploadFile] = []
     if files:
@@ -1328,7 +1364,7 @@ async def import_scan(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Uploaded image is empty.")
 
     try:
-        recipe_data = scan_service.import_scan(images)
+        recipe_data = await scan_service.import_scan_async(images)
     except NotImplementedError as exc:
         raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail=str(exc))
     except RuntimeError as exc:
@@ -1339,7 +1375,6 @@ async def import_scan(
         owner_id = _resolve_user_id(x_user_email, x_user_id)
         if has_data:
             _log_usage_events(
-                session,
                 owner_id,
                 request_id=request_id,
                 event_type="scan",
@@ -1347,23 +1382,7 @@ async def import_scan(
                 events=_extract_usage_events(recipe_data),
                 import_credits_used=1 if has_data else 0,
             )
-    return ImportResponse(recipe=recipe_data, languageCode=language_code)
-
-def _has_import_data(recipe_data: Dict[str, Any]) -> bool:
-    ingredients = recipe_data.get("ingredients") or []
-    instructions = recipe_data.get("instructions") or []
-    return bool(ingredients or instructions)
-
-
-def _extract_usage_events(recipe_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-    metadata = recipe_data.get("metadata") if isinstance(recipe_data, dict) else None
-    if not isinstance(metadata, dict):
-        return []
-    events = metadata.get("usageEvents")
-    if not isinstance(events, list):
-        return []
-    return [event for event in events if isinstance(event, dict)]
-
+    return _import_response(recipe=recipe_data, languageCode=language_code)
 
 
 @router.post("/assistant/recipe", response_model=RecipeAssistantResponse)
@@ -1409,7 +1428,6 @@ def recipe_assistant(
         owner_id = _resolve_user_id(x_user_email, x_user_id)
         _increment_ai_usage(session, owner_id, tokens_weighted, payload.usage_context)
         _log_usage_events(
-            session,
             owner_id,
             request_id=uuid4(),
             event_type="ai_assistant",
@@ -1436,30 +1454,21 @@ def usage_track(
     payload: UsageTrackRequest,
     x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
     x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
-    session: Session = Depends(get_db_session),
 ) -> Dict[str, bool]:
     if not x_user_email and not x_user_id:
         return {"ok": False}
     owner_id = _resolve_user_id(x_user_email, x_user_id)
-    session.add(
-        UsageEvent(
-            owner_id=owner_id,
-            request_id=uuid4(),
-            event_type=payload.event_type,
-            source=payload.source,
-            model_provider=None,
-            model_name=None,
-            tokens_input=0,
-            tokens_output=0,
-            tokens_total=0,
-            tokens_weighted=0,
-            ai_credits_used=0,
-            import_credits_used=0,
-            cost_usd=None,
-            metadata_={"usage_context": payload.usage_context} if payload.usage_context else {},
-        )
+    usage_event_queue.put_many(
+        [
+            _usage_event_row(
+                owner_id,
+                request_id=uuid4(),
+                event_type=payload.event_type,
+                source=payload.source,
+                metadata={"usage_context": payload.usage_context} if payload.usage_context else {},
+            )
+        ]
     )
-    session.commit()
     return {"ok": True}
 
 
@@ -1541,7 +1550,6 @@ def recipe_finder(
                 owner_id = _resolve_user_id(x_user_email, x_user_id)
                 _increment_ai_usage(session, owner_id, tokens_weighted, "finder")
                 _log_usage_events(
-                    session,
                     owner_id,
                     request_id=uuid4(),
                     event_type="ai_finder",
@@ -1572,13 +1580,14 @@ def recipe_finder(
     return RecipeFinderResponse(reply=fallback_reply.strip(), matches=fallback_matches[:3])
 
 
-def _normalize_text(value: Optional[str]) -> Optional[str]:
+def _normalize_optional_text(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
     cleaned = value.strip()
     return cleaned or None
 
 
+@lru_cache(maxsize=4096)
 def _resolve_user_id(raw_email: Optional[str], raw_user_id: Optional[str] = None) -> UUID:
     if raw_user_id:
         try:
@@ -1593,6 +1602,13 @@ def _resolve_user_id(raw_email: Optional[str], raw_user_id: Optional[str] = None
     return uuid5(NAMESPACE_DNS, f"recepify:{normalized}")
 
 
+def _current_user_id(
+    x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
+    x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
+) -> UUID:
+    return _resolve_user_id(x_user_email, x_user_id)
+
+
 def _get_period_start(reference: Optional[datetime] = None) -> date:
     point = reference or datetime.utcnow()
     return date(point.year, point.month, 1)
@@ -1693,8 +1709,44 @@ def _estimate_vision_cost_usd(images: int) -> Optional[float]:
     return round(images * per_image, 6)
 
 
+def _usage_event_row(
+    owner_id: UUID,
+    *,
+    request_id: UUID,
+    event_type: str,
+    source: Optional[str],
+    model_provider: Optional[str] = None,
+    model_name: Optional[str] = None,
+    tokens_input: int = 0,
+    tokens_output: int = 0,
+    tokens_total: int = 0,
+    tokens_weighted: int = 0,
+    ai_credits_used: int = 0,
+    import_credits_used: int = 0,
+    cost_usd: Optional[float] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    # Every row carries every column so a batch can be written with one executemany.
+    return {
+        "id": uuid4(),
+        "owner_id": owner_id,
+        "request_id": request_id,
+        "event_type": event_type,
+        "source": source,
+        "model_provider": model_provider,
+        "model_name": model_name,
+        "tokens_input": tokens_input,
+        "tokens_output": tokens_output,
+        "tokens_total": tokens_total,
+        "tokens_weighted": tokens_weighted,
+        "ai_credits_used": ai_credits_used,
+        "import_credits_used": import_credits_used,
+        "cost_usd": cost_usd,
+        "metadata": metadata or {},
+    }
+
+
 def _log_usage_events(
-    session: Session,
     owner_id: UUID,
     *,
     request_id: UUID,
@@ -1704,6 +1756,7 @@ def _log_usage_events(
     import_credits_used: Optional[int] = None,
 ) -> None:
     is_import_flow = event_type in {"import", "scan"}
+    rows: List[Dict[str, Any]] = []
     for event in events:
         provider = str(event.get("provider") or "")
         model = event.get("model")
@@ -1728,9 +1781,9 @@ def _log_usage_events(
             images = int(event.get("images") or 0)
             cost_usd = _estimate_vision_cost_usd(images)
 
-        session.add(
-            UsageEvent(
-                owner_id=owner_id,
+        rows.append(
+            _usage_event_row(
+                owner_id,
                 request_id=request_id,
                 event_type=event_type,
                 source=source,
@@ -1743,7 +1796,7 @@ def _log_usage_events(
                 ai_credits_used=ai_credits_used,
                 import_credits_used=import_credits_for_event,
                 cost_usd=cost_usd,
-                metadata_={
+                metadata={
                     k: v
                     for k, v in event.items()
                     if k not in {"provider", "model", "input_tokens", "output_tokens", "total_tokens"}
@@ -1752,26 +1805,69 @@ def _log_usage_events(
         )
 
     if import_credits_used is not None and import_credits_used > 0:
-        session.add(
-            UsageEvent(
-                owner_id=owner_id,
+        rows.append(
+            _usage_event_row(
+                owner_id,
                 request_id=request_id,
                 event_type="import_credit",
                 source=source,
-                model_provider=None,
-                model_name=None,
-                tokens_input=0,
-                tokens_output=0,
-                tokens_total=0,
-                tokens_weighted=0,
-                ai_credits_used=0,
                 import_credits_used=import_credits_used,
-                cost_usd=None,
-                metadata_={},
             )
         )
 
-    session.commit()
+    usage_event_queue.put_many(rows)
+
+
+def _shopping_list_stmt(user_id: UUID) -> StatementLambdaElement:
+    return lambda_stmt(
+        lambda: select(ShoppingListItem)
+        .where(ShoppingListItem.user_id == user_id)
+        .order_by(ShoppingListItem.created_at)
+    )
+
+
+def _recipe_collections_stmt(owner_id: UUID, dialect_name: str) -> Select:
+    # Aggregate recipe ids per collection in SQL, in the order they were added.
+    items = RecipeCollectionItem.__table__
+    columns = (RecipeCollection.id, RecipeCollection.name, RecipeCollection.created_at)
+    if dialect_name == "postgresql":
+        recipe_ids = func.array_agg(
+            aggregate_order_by(items.c.recipe_id, items.c.created_at, items.c.id)
+        ).filter(items.c.recipe_id.is_not(None))
+        stmt = (
+            select(*columns, recipe_ids.label("recipe_ids"))
+            .join(items, items.c.collection_id == RecipeCollection.id, isouter=True)
+            .group_by(*columns)
+        )
+    else:
+        # SQLite lacks array_agg and ignores ordering under GROUP BY, so concatenate
+        # each collection's pre-sorted items into a CSV in a correlated subquery.
+        ordered_items = (
+            select(items.c.recipe_id)
+            .where(items.c.collection_id == RecipeCollection.id)
+            .order_by(items.c.created_at, items.c.id)
+            .correlate(RecipeCollection)
+            .subquery()
+        )
+        recipe_ids = select(func.group_concat(ordered_items.c.recipe_id)).scalar_subquery()
+        stmt = select(*columns, recipe_ids.label("recipe_ids"))
+    return stmt.where(RecipeCollection.owner_id == owner_id).order_by(RecipeCollection.created_at)
+
+
+def _upsert_usage_counts(
+    session: Session, model: Any, key: Dict[str, Any], counts: Dict[str, int]
+) -> None:
+    # Concurrent first writes for a period meet on the unique (owner, period) index;
+    # ON CONFLICT adds to the existing row instead of failing the second request.
+    dialect_insert = pg_insert if session.get_bind().dialect.name == "postgresql" else sqlite_insert
+    stmt = dialect_insert(model).values(id=uuid4(), **key, **counts)
+    increments = {name: getattr(model, name) + stmt.excluded[name] for name in counts}
+    session.exec(
+        stmt.on_conflict_do_update(
+            index_elements=list(key),
+            set_={**increments, "updated_at": func.now()},
+        )
+    )
 
 
 def _increment_ai_usage(
@@ -1780,232 +1876,159 @@ def _increment_ai_usage(
     tokens: int,
     usage_context: Optional[str] = None,
 ) -> None:
-    period_start = _get_period_start()
-    existing = session.exec(
-        select(UsageMonthly).where(
-            UsageMonthly.owner_id == owner_id,
-            UsageMonthly.period_start == period_start,
-        )
-    ).first()
-    if existing:
-        if tokens > 0:
-            existing.ai_tokens += tokens
-        existing.updated_at = datetime.utcnow()
-    else:
-        session.add(
-            UsageMonthly(
-                owner_id=owner_id,
-                period_start=period_start,
-                import_count=0,
-                translations_count=0,
-                optimizations_count=0,
-                ai_messages_count=0,
-                ai_tokens=max(0, tokens),
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-        )
+    _upsert_usage_counts(
+        session,
+        UsageMonthly,
+        {"owner_id": owner_id, "period_start": _get_period_start()},
+        {
+            "import_count": 0,
+            "translations_count": 0,
+            "optimizations_count": 0,
+            "ai_messages_count": 0,
+            "ai_tokens": max(0, tokens),
+        },
+    )
     session.commit()
 
 
 def _increment_import_usage(session: Session, owner_id: UUID, source: str) -> None:
     period_start = _get_period_start()
-    usage = session.exec(
-        select(UsageMonthly).where(
-            UsageMonthly.owner_id == owner_id,
-            UsageMonthly.period_start == period_start,
-        )
-    ).first()
-    if usage:
-        usage.import_count += 1
-        usage.updated_at = datetime.utcnow()
-    else:
-        session.add(
-            UsageMonthly(
-                owner_id=owner_id,
-                period_start=period_start,
-                import_count=1,
-                translations_count=0,
-                optimizations_count=0,
-                ai_messages_count=0,
-                ai_tokens=0,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-        )
-    source_key = (source or "unknown").lower()
-    source_usage = session.exec(
-        select(ImportUsageMonthly).where(
-            ImportUsageMonthly.owner_id == owner_id,
-            ImportUsageMonthly.period_start == period_start,
-            ImportUsageMonthly.source == source_key,
-        )
-    ).first()
-    if source_usage:
-        source_usage.import_count += 1
-        source_usage.updated_at = datetime.utcnow()
-    else:
-        session.add(
-            ImportUsageMonthly(
-                owner_id=owner_id,
-                period_start=period_start,
-                source=source_key,
-                import_count=1,
-                updated_at=datetime.utcnow(),
-            )
-        )
+    _upsert_usage_counts(
+        session,
+        UsageMonthly,
+        {"owner_id": owner_id, "period_start": period_start},
+        {
+            "import_count": 1,
+            "translations_count": 0,
+            "optimizations_count": 0,
+            "ai_messages_count": 0,
+            "ai_tokens": 0,
+        },
+    )
+    _upsert_usage_counts(
+        session,
+        ImportUsageMonthly,
+        {
+            "owner_id": owner_id,
+            "period_start": period_start,
+            "source": (source or "unknown").lower(),
+        },
+        {"import_count": 1},
+    )
     session.commit()
 
 
 def _increment_action_usage(session: Session, owner_id: UUID, action: str) -> None:
-    period_start = _get_period_start()
-    usage = session.exec(
-        select(UsageMonthly).where(
-            UsageMonthly.owner_id == owner_id,
-            UsageMonthly.period_start == period_start,
-        )
-    ).first()
-    if usage:
-        if action == "translation":
-            usage.translations_count += 1
-        elif action == "optimization":
-            usage.optimizations_count += 1
-        elif action == "ai_message":
-            usage.ai_messages_count += 1
-        usage.updated_at = datetime.utcnow()
-    else:
-        session.add(
-            UsageMonthly(
-                owner_id=owner_id,
-                period_start=period_start,
-                import_count=0,
-                translations_count=1 if action == "translation" else 0,
-                optimizations_count=1 if action == "optimization" else 0,
-                ai_messages_count=1 if action == "ai_message" else 0,
-                ai_tokens=0,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-            )
-        )
+    _upsert_usage_counts(
+        session,
+        UsageMonthly,
+        {"owner_id": owner_id, "period_start": _get_period_start()},
+        {
+            "import_count": 0,
+            "translations_count": 1 if action == "translation" else 0,
+            "optimizations_count": 1 if action == "optimization" else 0,
+            "ai_messages_count": 1 if action == "ai_message" else 0,
+            "ai_tokens": 0,
+        },
+    )
     session.commit()
 
 
 @router.get("/shopping-list", response_model=List[ShoppingListItemDTO])
 def get_shopping_list_items(
-    x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
-    x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
+    user_id: UUID = Depends(_current_user_id),
     session: Session = Depends(get_db_session),
 ) -> List[ShoppingListItemDTO]:
-    user_id = _resolve_user_id(x_user_email, x_user_id)
-    items = session.exec(
-        select(ShoppingListItem)
-        .where(ShoppingListItem.user_id == user_id)
-        .order_by(ShoppingListItem.created_at)
-    ).all()
+    items = session.exec(_shopping_list_stmt(user_id)).scalars().all()
     return items
 
 
 @router.put("/shopping-list", response_model=List[ShoppingListItemDTO])
 def replace_shopping_list_items(
     payload: ShoppingListSyncDTO,
-    x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
-    x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
+    user_id: UUID = Depends(_current_user_id),
     session: Session = Depends(get_db_session),
 ) -> List[ShoppingListItemDTO]:
-    user_id = _resolve_user_id(x_user_email, x_user_id)
-    existing_items = session.exec(
-        select(ShoppingListItem).where(ShoppingListItem.user_id == user_id)
-    ).all()
-    for item in existing_items:
-        session.delete(item)
-    session.commit()
+    session.exec(
+        delete(ShoppingListItem)
+        .where(ShoppingListItem.user_id == user_id)
+        .execution_options(synchronize_session=False)
+    )
 
     now = datetime.utcnow()
-    new_items: List[ShoppingListItem] = []
+    rows: List[Dict[str, Any]] = []
     for entry in payload.items:
-        normalized_name = _normalize_text(entry.name)
+        normalized_name = _normalize_optional_text(entry.name)
         if not normalized_name:
             continue
-        normalized_amount = _normalize_text(entry.amount)
-        item = ShoppingListItem(
-            id=entry.id or uuid4(),
-            user_id=user_id,
-            name=normalized_name,
-            amount=normalized_amount,
-            is_checked=bool(entry.is_checked),
-            recipe_id=_normalize_text(entry.recipe_id),
-            recipe_name=_normalize_text(entry.recipe_name),
-            created_at=now,
-            updated_at=now,
+        rows.append(
+            {
+                "id": entry.id or uuid4(),
+                "user_id": user_id,
+                "name": normalized_name,
+                "amount": _normalize_optional_text(entry.amount),
+                "is_checked": bool(entry.is_checked),
+                "recipe_id": _normalize_optional_text(entry.recipe_id),
+                "recipe_name": _normalize_optional_text(entry.recipe_name),
+                "created_at": now,
+                "updated_at": now,
+            }
         )
-        new_items.append(item)
 
-    if new_items:
-        session.add_all(new_items)
+    # Append-only rows go through a single Core INSERT; no ORM instances are needed.
+    if rows:
+        session.exec(insert(ShoppingListItem), params=rows)
     session.commit()
-    return new_items
+    return SHOPPING_LIST_ADAPTER.validate_python(rows)
 
 
 @router.get("/collections", response_model=List[RecipeCollectionDTO])
 def get_recipe_collections(
-    x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
-    x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
+    user_id: UUID = Depends(_current_user_id),
     session: Session = Depends(get_db_session),
 ) -> List[RecipeCollectionDTO]:
-    user_id = _resolve_user_id(x_user_email, x_user_id)
-    collections = session.exec(
-        select(RecipeCollection)
-        .where(RecipeCollection.owner_id == user_id)
-        .order_by(RecipeCollection.created_at)
-    ).all()
-    if not collections:
-        return []
-    collection_ids = [collection.id for collection in collections]
-    items = session.exec(
-        select(RecipeCollectionItem).where(RecipeCollectionItem.collection_id.in_(collection_ids))
-    ).all()
-    item_map: Dict[UUID, List[UUID]] = {collection_id: [] for collection_id in collection_ids}
-    for item in items:
-        item_map.setdefault(item.collection_id, []).append(item.recipe_id)
-    return [
-        RecipeCollectionDTO(
-            id=collection.id,
-            name=collection.name,
-            recipe_ids=item_map.get(collection.id, []),
-            created_at=collection.created_at,
+    dialect_name = session.get_bind().dialect.name
+    rows = session.exec(_recipe_collections_stmt(user_id, dialect_name)).all()
+    collections: List[Dict[str, Any]] = []
+    for row in rows:
+        recipe_ids = row.recipe_ids or []
+        if isinstance(recipe_ids, str):
+            recipe_ids = recipe_ids.split(",")
+        collections.append(
+            {
+                "id": row.id,
+                "name": row.name,
+                "recipe_ids": recipe_ids,
+                "created_at": row.created_at,
+            }
         )
-        for collection in collections
-    ]
+    return RECIPE_COLLECTION_LIST_ADAPTER.validate_python(collections)
 
 
 @router.put("/collections", response_model=List[RecipeCollectionDTO])
 def replace_recipe_collections(
     payload: RecipeCollectionsSyncDTO,
-    x_user_email: Optional[str] = Header(default=None, alias="X-User-Email"),
-    x_user_id: Optional[str] = Header(default=None, alias="X-User-Id"),
+    user_id: UUID = Depends(_current_user_id),
     session: Session = Depends(get_db_session),
 ) -> List[RecipeCollectionDTO]:
-    user_id = _resolve_user_id(x_user_email, x_user_id)
-    existing = session.exec(
-        select(RecipeCollection).where(RecipeCollection.owner_id == user_id)
-    ).all()
-    existing_ids = [collection.id for collection in existing]
-    if existing_ids:
-        existing_items = session.exec(
-            select(RecipeCollectionItem).where(RecipeCollectionItem.collection_id.in_(existing_ids))
-        ).all()
-        for item in existing_items:
-            session.delete(item)
-        for collection in existing:
-            session.delete(collection)
-        session.commit()
+    owned_collection_ids = select(RecipeCollection.id).where(RecipeCollection.owner_id == user_id)
+    session.exec(
+        delete(RecipeCollectionItem)
+        .where(RecipeCollectionItem.collection_id.in_(owned_collection_ids))
+        .execution_options(synchronize_session=False)
+    )
+    session.exec(
+        delete(RecipeCollection)
+        .where(RecipeCollection.owner_id == user_id)
+        .execution_options(synchronize_session=False)
+    )
 
     now = datetime.utcnow()
     new_collections: List[RecipeCollection] = []
     new_items: List[RecipeCollectionItem] = []
 
     for entry in payload.collections:
-        normalized_name = _normalize_text(entry.name)
+        normalized_name = _normalize_optional_text(entry.name)
         if not normalized_name:
             continue
         collection_id = entry.id or uuid4()
@@ -2017,12 +2040,14 @@ def replace_recipe_collections(
         )
         new_collections.append(collection)
         for recipe_id in entry.recipe_ids:
+            # Collection reads order ids by created_at, so keep it strictly increasing
+            # in payload order rather than stamping the whole sync with one instant.
             new_items.append(
                 RecipeCollectionItem(
                     id=uuid4(),
                     collection_id=collection_id,
                     recipe_id=recipe_id,
-                    created_at=now,
+                    created_at=now + timedelta(microseconds=len(new_items)),
                 )
             )
 
@@ -2035,12 +2060,14 @@ def replace_recipe_collections(
     item_map: Dict[UUID, List[UUID]] = {collection.id: [] for collection in new_collections}
     for item in new_items:
         item_map.setdefault(item.collection_id, []).append(item.recipe_id)
-    return [
-        RecipeCollectionDTO(
-            id=collection.id,
-            name=collection.name,
-            recipe_ids=item_map.get(collection.id, []),
-            created_at=collection.created_at,
-        )
-        for collection in new_collections
-    ]
+    return RECIPE_COLLECTION_LIST_ADAPTER.validate_python(
+        [
+            {
+                "id": collection.id,
+                "name": collection.name,
+                "recipe_ids": item_map.get(collection.id, []),
+                "created_at": collection.created_at,
+            }
+            for collection in new_collections
+        ]
+    )
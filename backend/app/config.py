@@ -25,9 +25,11 @@ class Settings(BaseSettings):
     scan_jpeg_quality: int = 80
     scan_retry_attempts: int = 2
     scan_retry_delay_seconds: float = 1.5
+    scan_cache_enabled: bool = False
     google_vision_api_key: Optional[str] = None
     assistant_model_priority: str = "gpt-4o,gpt-4o-mini,o4-mini"
     assistant_disable_finder_ai: bool = False
+    run_migrations_on_startup: bool = False
 
 
 @lru_cache
@@ -3,6 +3,7 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Any, Dict
 
+from sqlalchemy import event
 from sqlmodel import SQLModel, Session, create_engine
 
 from .config import get_settings
@@ -26,6 +27,20 @@ engine = create_engine(
 )
 
 
+if settings.database_url.startswith("sqlite"):
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection: Any, _connection_record: Any) -> None:
+        # WAL lets readers proceed during writes; NORMAL sync is safe under WAL.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+
+
 def init_db() -> None:
     SQLModel.metadata.create_all(engine)
 
@@ -6,6 +6,8 @@ from .config import get_settings
 
 from .api.routes import router as api_router
 from .database import init_db
+from .services.import_utils import shutdown_playwright
+from .usage_queue import usage_event_queue
 
 app = FastAPI(title="Recipefy API", version="0.1.0")
 settings = get_settings()
@@ -30,7 +32,9 @@ app.add_middleware(
 
 @app.on_event("startup")
 def on_startup() -> None:
-    init_db()
+    if settings.run_migrations_on_startup:
+        init_db()
+    usage_event_queue.start()
     print(
         "Storage config:",
         f"supabase_url={settings.supabase_url}",
@@ -42,6 +46,12 @@ def on_startup() -> None:
     print("Backend build: dashboard hotfix", flush=True)
 
 
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    usage_event_queue.stop()
+    shutdown_playwright()
+
+
 @app.get("/health")
 def health_check() -> dict[str, str]:
     return {"status": "ok"}
@@ -2,7 +2,7 @@ from datetime import datetime, date
 from typing import List, Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, Index, JSON, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -102,6 +102,7 @@ class UserSettings(SQLModel, table=True):
 
 class ShoppingListItem(SQLModel, table=True):
     __tablename__ = "shopping_list_item"
+    __table_args__ = (Index("ix_shopping_user_created", "user_id", "created_at"),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     user_id: UUID = Field(index=True)
@@ -116,6 +117,7 @@ class ShoppingListItem(SQLModel, table=True):
 
 class RecipeCollection(SQLModel, table=True):
     __tablename__ = "recipe_collections"
+    __table_args__ = (Index("ix_rc_owner_created", "owner_id", "created_at"),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     owner_id: UUID = Field(index=True)
@@ -134,6 +136,7 @@ class RecipeCollectionItem(SQLModel, table=True):
 
 class UsageMonthly(SQLModel, table=True):
     __tablename__ = "usage_monthly"
+    __table_args__ = (Index("ix_usage_monthly_owner_period", "owner_id", "period_start", unique=True),)
 
     id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     owner_id: UUID = Field(index=True)
@@ -143,19 +146,28 @@ class UsageMonthly(SQLModel, table=True):
     optimizations_count: int = Field(default=0)
     ai_messages_count: int = Field(default=0)
     ai_tokens: int = Field(default=0)
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(nullable=False, sa_column_kwargs={"server_default": func.now()})
+    updated_at: datetime = Field(
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    )
 
 
 class ImportUsageMonthly(SQLModel, table=True):
     __tablename__ = "import_usage_monthly"
+    __table_args__ = (
+        Index("ix_import_usage_owner_period_source", "owner_id", "period_start", "source", unique=True),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     owner_id: UUID = Field(index=True)
     period_start: date = Field(index=True)
     source: str = Field(index=True)
     import_count: int = Field(default=0)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    updated_at: datetime = Field(
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
+    )
 
 
 class UsageEvent(SQLModel, table=True):
@@ -176,11 +188,14 @@ class UsageEvent(SQLModel, table=True):
     import_credits_used: int = Field(default=0)
     cost_usd: Optional[float] = Field(default=None)
     metadata_: dict = Field(default_factory=dict, sa_column=Column("metadata", JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    created_at: datetime = Field(nullable=False, sa_column_kwargs={"server_default": func.now()})
 
 
 class GlobalRecipe(SQLModel, table=True):
     __tablename__ = "global_recipes"
+    __table_args__ = (
+        Index("ix_globalrecipe_url_live", "source_url_normalized", "supersedes_id", "updated_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     source_url: str
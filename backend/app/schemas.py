@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class IngredientDTO(BaseModel):
@@ -124,3 +124,8 @@ class RecipeCollectionDTO(BaseModel):
 
 class RecipeCollectionsSyncDTO(BaseModel):
     collections: List[RecipeCollectionDTO] = Field(default_factory=list)
+
+
+# Built once so list responses validate in a single pydantic-core call.
+SHOPPING_LIST_ADAPTER = TypeAdapter(List[ShoppingListItemDTO])
+RECIPE_COLLECTION_LIST_ADAPTER = TypeAdapter(List[RecipeCollectionDTO])
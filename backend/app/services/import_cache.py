@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import re
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 from uuid import UUID, uuid4
 
+from sqlalchemy import Row
 from sqlmodel import Session, select
 
 from ..models import GlobalRecipe
@@ -16,68 +19,160 @@ logger = logging.getLogger(__name__)
 
 QUALITY_MIN_SCORE = 70
 FRESH_DAYS = 30
-TRACKING_PARAMS = {
-    "fbclid",
-    "gclid",
-    "igshid",
-    "utm_source",
-    "utm_medium",
-    "utm_campaign",
-    "utm_term",
-    "utm_content",
-    "utm_id",
-}
-
-
+# Every utm_* parameter is dropped by prefix; these are the remaining exact-match trackers.
+TRACKING_PARAMS = frozenset({"fbclid", "gclid", "igshid"})
+
+
+GERMAN_INDICATORS = (
+    " und ",
+    " mit ",
+    " zutaten",
+    " ofen",
+    " pfanne",
+    " minuten",
+    " gramm",
+    " el ",
+    " tl ",
+    " die ",
+    " der ",
+    " das ",
+    " zubereitung",
+)
+ENGLISH_INDICATORS = (
+    " and ",
+    " with ",
+    " ingredients",
+    " oven",
+    " pan",
+    " minutes",
+    " tbsp",
+    " tsp",
+    " cups",
+    " preheat",
+    " bake",
+    " serve",
+)
+
+
+def _compile_indicator_pattern(indicators: Tuple[str, ...]) -> "re.Pattern[str]":
+    # Lookahead so indicators sharing a boundary space (" und die ") are all found in one pass.
+    return re.compile("(?=(" + "|".join(re.escape(token) for token in indicators) + "))")
+
+
+GERMAN_INDICATOR_PATTERN = _compile_indicator_pattern(GERMAN_INDICATORS)
+ENGLISH_INDICATOR_PATTERN = _compile_indicator_pattern(ENGLISH_INDICATORS)
+
+
+URL_SCHEME_PATTERN = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*")
+# Characters urlparse treats specially (queries, params, IPv6 hosts).
+URL_SLOW_PATH_CHARS = frozenset("?;[]")
+
+
+def _fast_normalize_url(url: str) -> Optional[str]:
+    """String-split normalization for plain scheme://host/path URLs.
+
+    Returns None when the URL needs the full urlparse path, so stored keys never change.
+    """
+    if not (url.isascii() and url.isprintable()) or not URL_SLOW_PATH_CHARS.isdisjoint(url):
+        return None
+    scheme, sep, rest = url.partition("://")
+    if not sep or not URL_SCHEME_PATTERN.fullmatch(scheme):
+        return None
+    rest = rest.partition("#")[0]
+    slash = rest.find("/")
+    netloc, path = (rest, "") if slash == -1 else (rest[:slash], rest[slash:])
+    if not netloc:
+        return None
+    return f"{scheme.lower()}://{netloc.lower()}{path.rstrip('/') or '/'}"
+
+
+@lru_cache(maxsize=4096)
 def normalize_url(raw_url: str) -> str:
+    fast = _fast_normalize_url(raw_url.strip())
+    if fast is not None:
+        return fast
     parsed = urlparse(raw_url.strip())
-    query_params = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)]
-    filtered = [(k, v) for k, v in query_params if k.lower() not in TRACKING_PARAMS and not k.lower().startswith("utm_")]
+    filtered = []
+    if parsed.query:
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True):
+            lowered = key.lower()
+            if lowered.startswith("utm_") or lowered in TRACKING_PARAMS:
+                continue
+            filtered.append((key, value))
     normalized = parsed._replace(
         scheme=parsed.scheme.lower() or "https",
         netloc=parsed.netloc.lower(),
         path=parsed.path.rstrip("/") or "/",
-        query=urlencode(filtered, doseq=True),
+        query=urlencode(filtered, doseq=True) if filtered else "",
         fragment="",
     )
     return urlunparse(normalized)
 
 
 def _normalize_text(value: Optional[str]) -> str:
-    return clean_text(value or "").lower()
+    # clean_text keeps case, so lowercasing stays here; empty values skip both passes.
+    if not value:
+        return ""
+    return clean_text(value).lower()
+
+
+class _PreparedRecipe(NamedTuple):
+    """Normalized text shared by scoring, language detection and hashing."""
+
+    title: str
+    description: str
+    ingredient_lines: List[str]
+    ingredient_names: List[str]
+    instruction_texts: List[str]
+
+
+def _dict_items(values: Any) -> List[Dict[str, Any]]:
+    return [item for item in values or [] if isinstance(item, dict)]
+
+
+def _prepare_recipe(recipe_data: Dict[str, Any]) -> _PreparedRecipe:
+    # Expects ingredients/instructions already narrowed to dicts by _dict_items.
+    ingredient_lines: List[str] = []
+    ingredient_names: List[str] = []
+    for item in recipe_data.get("ingredients") or []:
+        name = _normalize_text(item.get("name"))
+        line = item.get("line")
+        ingredient_lines.append(_normalize_text(line) if line else name)
+        ingredient_names.append(name)
+    instruction_texts = [_normalize_text(item.get("text")) for item in recipe_data.get("instructions") or []]
+    return _PreparedRecipe(
+        title=_normalize_text(recipe_data.get("title")),
+        description=_normalize_text(recipe_data.get("description")),
+        ingredient_lines=ingredient_lines,
+        ingredient_names=ingredient_names,
+        instruction_texts=instruction_texts,
+    )
 
 
-def _build_canonical_hash(recipe_data: Dict[str, Any]) -> str:
-    title = _normalize_text(recipe_data.get("title"))
-    ingredients = recipe_data.get("ingredients") or []
-    instructions = recipe_data.get("instructions") or []
-    ingredient_lines = [
-        _normalize_text(item.get("line") or item.get("name") or "")
-        for item in ingredients
-        if isinstance(item, dict)
-    ]
-    instruction_lines = [
-        _normalize_text(item.get("text") or "")
-        for item in instructions
-        if isinstance(item, dict)
-    ]
-    payload = "\n".join([title, *ingredient_lines, *instruction_lines])
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
-
-
-def _score_recipe(recipe_data: Dict[str, Any]) -> Tuple[int, bool, list[str]]:
+def _build_canonical_hash(prepared: _PreparedRecipe) -> str:
+    # Equivalent to hashing "\n".join([title, *ingredient_lines, *instruction_lines]).
+    hasher = hashlib.blake2b(digest_size=32)
+    hasher.update(prepared.title.encode("utf-8"))
+    for line in prepared.ingredient_lines:
+        hasher.update(b"\n")
+        hasher.update(line.encode("utf-8"))
+    for text in prepared.instruction_texts:
+        hasher.update(b"\n")
+        hasher.update(text.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _score_recipe(recipe_data: Dict[str, Any], prepared: _PreparedRecipe) -> Tuple[int, bool, list[str]]:
     missing: list[str] = []
     ingredients = recipe_data.get("ingredients") or []
     instructions = recipe_data.get("instructions") or []
-    title = clean_text(recipe_data.get("title"))
-    description = clean_text(recipe_data.get("description"))
 
     score = 0
-    if title:
+    if prepared.title:
         score += 10
     else:
         missing.append("title")
-    if description:
+    if prepared.description:
         score += 10
     if ingredients:
         score += 35
@@ -94,54 +189,31 @@ def _score_recipe(recipe_data: Dict[str, Any]) -> Tuple[int, bool, list[str]]:
     return score, is_complete, missing
 
 
-def detect_language(recipe_data: Dict[str, Any]) -> str:
-    parts = [
-        recipe_data.get("title"),
-        recipe_data.get("description"),
-        " ".join([item.get("name", "") for item in recipe_data.get("ingredients") or [] if isinstance(item, dict)]),
-        " ".join([item.get("text", "") for item in recipe_data.get("instructions") or [] if isinstance(item, dict)]),
-    ]
-    text = " ".join([clean_text(str(value)) for value in parts if value]).lower()
+def _detect_prepared_language(prepared: _PreparedRecipe) -> str:
+    # Parts are already whitespace-collapsed and lowercased; joining the non-empty
+    # ones matches cleaning the raw concatenation.
+    parts = [prepared.title, prepared.description, *prepared.ingredient_names, *prepared.instruction_texts]
+    text = " ".join([part for part in parts if part])
     if not text:
         return "en"
 
-    german_indicators = [
-        " und ",
-        " mit ",
-        " zutaten",
-        " ofen",
-        " pfanne",
-        " minuten",
-        " gramm",
-        " el ",
-        " tl ",
-        " die ",
-        " der ",
-        " das ",
-        " zubereitung",
-    ]
-    english_indicators = [
-        " and ",
-        " with ",
-        " ingredients",
-        " oven",
-        " pan",
-        " minutes",
-        " tbsp",
-        " tsp",
-        " cups",
-        " preheat",
-        " bake",
-        " serve",
-    ]
-    german_score = sum(1 for token in german_indicators if token in text)
-    english_score = sum(1 for token in english_indicators if token in text)
+    german_score = len(set(GERMAN_INDICATOR_PATTERN.findall(text)))
+    english_score = len(set(ENGLISH_INDICATOR_PATTERN.findall(text)))
     if any(char in text for char in ["ä", "ö", "ü", "ß"]):
         german_score += 2
     return "de" if german_score > english_score else "en"
 
 
-def _is_better(new_score: int, new_complete: bool, existing: GlobalRecipe) -> bool:
+def detect_language(recipe_data: Dict[str, Any]) -> str:
+    narrowed = {
+        **recipe_data,
+        "ingredients": _dict_items(recipe_data.get("ingredients")),
+        "instructions": _dict_items(recipe_data.get("instructions")),
+    }
+    return _detect_prepared_language(_prepare_recipe(narrowed))
+
+
+def _is_better(new_score: int, new_complete: bool, existing: Row) -> bool:
     if existing.is_complete and not new_complete:
         return False
     if new_complete and not existing.is_complete:
@@ -149,7 +221,7 @@ def _is_better(new_score: int, new_complete: bool, existing: GlobalRecipe) -> bo
     return new_score > existing.quality_score
 
 
-def _should_reimport(existing: Optional[GlobalRecipe]) -> bool:
+def _should_reimport(existing: Optional[Row]) -> bool:
     if not existing:
         return True
     if not existing.is_complete:
@@ -165,6 +237,7 @@ def _should_reimport(existing: Optional[GlobalRecipe]) -> bool:
 
 
 def _to_recipe_payload(global_recipe: GlobalRecipe) -> Dict[str, Any]:
+    # Keep this a single literal: CPython builds it from one constant tuple of interned keys.
     return {
         "title": global_recipe.title,
         "description": global_recipe.description,
@@ -196,29 +269,44 @@ def import_with_cache(
     fetcher: Callable[[str], Tuple[Dict[str, Any], Optional[str]]],
 ) -> Tuple[Dict[str, Any], Optional[str], Optional[GlobalRecipe], bool, str]:
     normalized = normalize_url(url)
-    existing = session.exec(
-        select(GlobalRecipe)
+    # Decide freshness from a narrow row; the JSON-heavy recipe is loaded only when returned.
+    live = session.exec(
+        select(
+            GlobalRecipe.id,
+            GlobalRecipe.is_complete,
+            GlobalRecipe.quality_score,
+            GlobalRecipe.last_fetched_at,
+            GlobalRecipe.canonical_group_id,
+        )
         .where(GlobalRecipe.source_url_normalized == normalized)
         .where(GlobalRecipe.supersedes_id.is_(None))
         .order_by(GlobalRecipe.updated_at.desc())
+        .limit(1)
     ).first()
 
-    if existing and not _should_reimport(existing):
+    if live and not _should_reimport(live):
+        existing = session.get(GlobalRecipe, live.id)
         return _to_recipe_payload(existing), None, existing, True, existing.language_code or "en"
 
     try:
         recipe_data, video_path = fetcher(url)
     except Exception as exc:
-        if existing:
+        if live:
+            existing = session.get(GlobalRecipe, live.id)
             logger.warning("Import failed, using cached recipe for %s: %s", url, exc)
             return _to_recipe_payload(existing), None, existing, True, existing.language_code or "en"
         raise
 
-    score, is_complete, missing_fields = _score_recipe(recipe_data)
-    language_code = detect_language(recipe_data)
-    canonical_hash = _build_canonical_hash(recipe_data)
-    canonical_group_id = existing.canonical_group_id if existing and existing.canonical_group_id else uuid4()
+    # Importers promise dict-shaped items; enforce it once here instead of in every helper.
+    recipe_data["ingredients"] = _dict_items(recipe_data.get("ingredients"))
+    recipe_data["instructions"] = _dict_items(recipe_data.get("instructions"))
+    prepared = _prepare_recipe(recipe_data)
+    score, is_complete, missing_fields = _score_recipe(recipe_data, prepared)
+    language_code = _detect_prepared_language(prepared)
+    canonical_hash = _build_canonical_hash(prepared)
+    canonical_group_id = live.canonical_group_id if live and live.canonical_group_id else uuid4()
 
+    now = datetime.now(timezone.utc)
     media_image_url = recipe_data.get("mediaImageUrl") or recipe_data.get("mediaLocalPath")
     media_video_url = recipe_data.get("mediaVideoUrl")
 
@@ -248,16 +336,17 @@ def import_with_cache(
         quality_score=score,
         is_complete=is_complete,
         missing_fields=missing_fields,
-        last_fetched_at=datetime.utcnow(),
+        last_fetched_at=now,
         canonical_hash=canonical_hash,
         canonical_group_id=canonical_group_id,
-        supersedes_id=existing.id if existing else None,
-        updated_at=datetime.utcnow(),
+        supersedes_id=live.id if live else None,
+        updated_at=now,
     )
 
-    if existing and not _is_better(score, is_complete, existing):
-        existing.last_fetched_at = datetime.utcnow()
-        existing.updated_at = datetime.utcnow()
+    if live and not _is_better(score, is_complete, live):
+        existing = session.get(GlobalRecipe, live.id)
+        existing.last_fetched_at = now
+        existing.updated_at = now
         session.add(existing)
         session.commit()
         return _to_recipe_payload(existing), video_path, existing, True, existing.language_code or "en"
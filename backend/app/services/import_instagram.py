@@ -1,19 +1,18 @@
 from __future__ import annotations
 
-import json
 import re
 import os
+import queue
 import re
-import shutil
 import subprocess
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
-import httpx
-from bs4 import BeautifulSoup
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 from .import_utils import (
@@ -22,12 +21,26 @@ from .import_utils import (
     clean_text,
     ensure_domain,
     ensure_storage_path,
+    find_executable,
+    get_http_client,
     get_openai_client,
     instructions_from_strings,
+    parse_ffmpeg_duration,
+    run_with_browser,
     sync_recipe_media_to_supabase,
 )
 from .usage_utils import append_usage_event, build_usage_event, extract_openai_usage
 
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# Grayscale -> black/white lookup; Tesseract reads binarized text faster and more reliably.
+OCR_THRESHOLD_TABLE = [0] * 181 + [255] * 75
+ZERO_AMOUNTS = frozenset({"0", "0.0", "0,0"})
+COOKIE_BUTTON_PATTERN = re.compile(
+    # Anchored to the whole label so "Only accept necessary cookies" never matches.
+    r"^\s*(?:Alle Cookies erlauben|Alle akzeptieren|Akzeptieren|Allow all cookies|Accept all|Accept)\s*$",
+    re.IGNORECASE,
+)
+
 
 class _IngredientLine(BaseModel):
     name: str
@@ -40,7 +53,7 @@ class _IngredientLine(BaseModel):
             return None
         if isinstance(value, (int, float)) and value == 0:
             return None
-        if isinstance(value, str) and value.strip() in {"0", "0.0", "0,0"}:
+        if isinstance(value, str) and value.strip() in ZERO_AMOUNTS:
             return None
         return value
 
@@ -68,62 +81,65 @@ class _InstagramRecipe(BaseModel):
 
 
 def _clean_ws(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "")).strip()
+    return WHITESPACE_PATTERN.sub(" ", text or "").strip()
 
 
 def _fetch_instagram_oembed(instagram_url: str) -> dict[str, Any]:
     endpoint = f"https://api.instagram.com/oembed/?url={quote(instagram_url, safe='')}"
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept-Language": "de,en;q=0.8",
-    }
     try:
-        with httpx.Client(headers=headers, timeout=20.0, follow_redirects=True) as client:
-            response = client.get(endpoint)
-            response.raise_for_status()
-            return response.json()
+        response = get_http_client().get(endpoint, timeout=20.0)
+        response.raise_for_status()
+        payload = response.json()
+        # The embed markup is never used as a signal; drop it once here.
+        payload.pop("html", None)
+        return payload
     except Exception as exc:
         return {"_error": str(exc)}
 
 
-def _download_instagram_video(instagram_url: str) -> Optional[Path]:
+def _download_instagram_video(instagram_url: str) -> Tuple[Optional[Path], Optional[float]]:
     target_dir = ensure_storage_path("instagram", is_file=False)
     file_id = uuid.uuid4().hex[:8]
     output_template = target_dir / f"instagram_{file_id}.%(ext)s"
 
-    yt_dlp_cmd = shutil.which("yt-dlp")
+    yt_dlp_cmd = find_executable("yt-dlp")
     base_cmd = [yt_dlp_cmd] if yt_dlp_cmd else [sys.executable, "-m", "yt_dlp"]
     command = base_cmd + [
         "-f",
         "bv*+ba/best",
         "--no-playlist",
         "--restrict-filenames",
+        # Emit the clip length once the file is in place so no ffprobe pass is needed.
+        "--print",
+        "after_move:%(duration)s",
         "-o",
         str(output_template),
         instagram_url,
     ]
     result = subprocess.run(command, capture_output=True, text=True)
     if result.returncode != 0:
-        return None
+        return None, None
+
+    duration: Optional[float] = None
+    printed = [line for line in (result.stdout or "").splitlines() if line.strip()]
+    if printed:
+        try:
+            duration = float(printed[-1])
+        except ValueError:
+            duration = None
 
     candidates = sorted(
         target_dir.glob(f"instagram_{file_id}.*"),
         key=lambda path: path.stat().st_mtime,
         reverse=True,
     )
-    return candidates[0] if candidates else None
+    return (candidates[0] if candidates else None), duration
 
 
-def _extract_audio(video_path: Path) -> Optional[Path]:
-    audio_dir = ensure_storage_path("instagram", "audio", is_file=False)
-    output_path = audio_dir / f"audio_{uuid.uuid4().hex[:8]}.mp3"
+def _extract_audio(video_path: Path) -> Tuple[Optional[bytes], Optional[float]]:
+    # Encode straight to stdout: the mp3 is only ever uploaded, never kept on disk.
     command = [
         "ffmpeg",
-        "-y",
         "-i",
         str(video_path),
         "-vn",
@@ -133,21 +149,25 @@ def _extract_audio(video_path: Path) -> Optional[Path]:
         "16000",
         "-ac",
         "1",
-        str(output_path),
+        "-f",
+        "mp3",
+        "pipe:1",
     ]
     try:
-        result = subprocess.run(command, capture_output=True, text=True)
+        result = subprocess.run(command, capture_output=True)
     except FileNotFoundError:
-        return None
-    if result.returncode != 0:
-        return None
-    return output_path
+        return None, None
+    if result.returncode != 0 or not result.stdout:
+        return None, None
+    return result.stdout, parse_ffmpeg_duration(result.stderr.decode("utf-8", errors="replace"))
 
 
-def _transcribe_audio(audio_path: Path) -> str:
+def _transcribe_audio(audio: bytes) -> str:
     client = get_openai_client()
-    with audio_path.open("rb") as file_obj:
-        transcript = client.audio.transcriptions.create(model="whisper-1", file=file_obj)
+    transcript = client.audio.transcriptions.create(
+        model="whisper-1",
+        file=(f"audio_{uuid.uuid4().hex[:8]}.mp3", audio),
+    )
     text = getattr(transcript, "text", None)
     if text:
         return text
@@ -156,133 +176,91 @@ def _transcribe_audio(audio_path: Path) -> str:
     return ""
 
 
-def _get_audio_duration_seconds(audio_path: Path) -> Optional[float]:
-    command = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-show_entries",
-        "format=duration",
-        "-of",
-        "default=noprint_wrappers=1:nokey=1",
-        str(audio_path),
-    ]
-    try:
-        result = subprocess.run(command, capture_output=True, text=True)
-    except FileNotFoundError:
-        result = None
-    if result.returncode != 0:
-        result = None
-    if result:
-        try:
-            return float(result.stdout.strip())
-        except ValueError:
-            pass
-    # Fallback: parse ffmpeg output if ffprobe is unavailable.
-    command = ["ffmpeg", "-i", str(audio_path)]
-    try:
-        fallback = subprocess.run(command, capture_output=True, text=True)
-    except FileNotFoundError:
-        return None
-    match = re.search(r"Duration:\s(\d+):(\d+):(\d+\.?\d*)", fallback.stderr or "")
-    if not match:
-        return None
-    try:
-        hours = float(match.group(1))
-        minutes = float(match.group(2))
-        seconds = float(match.group(3))
-    except ValueError:
-        return None
-    return hours * 3600 + minutes * 60 + seconds
-
-
-def _html_meta(html: str) -> Dict[str, Optional[str]]:
-    soup = BeautifulSoup(html, "html.parser")
-
-    def meta(prop: Optional[str] = None, name: Optional[str] = None) -> Optional[str]:
-        if prop:
-            tag = soup.find("meta", attrs={"property": prop})
-            return _clean_ws(tag.get("content")) if tag and tag.get("content") else None
-        if name:
-            tag = soup.find("meta", attrs={"name": name})
-            return _clean_ws(tag.get("content")) if tag and tag.get("content") else None
-        return None
-
-    title_tag = soup.title.get_text(strip=True) if soup.title else None
+# Reads everything the rescue needs from the live DOM in one CDP round-trip.
+PAGE_SIGNALS_SCRIPT = """() => {
+    const meta = (selector) => document.querySelector(selector)?.getAttribute("content") || null;
+    const article = document.querySelector("article");
+    const rect = article ? article.getBoundingClientRect() : null;
     return {
-        "title_tag": _clean_ws(title_tag) if title_tag else None,
-        "og_title": meta(prop="og:title"),
-        "og_description": meta(prop="og:description"),
-        "og_image": meta(prop="og:image"),
-        "og_url": meta(prop="og:url"),
-        "meta_description": meta(name="description"),
-    }
+        title_tag: document.querySelector("title")?.textContent || null,
+        og_title: meta('meta[property="og:title"]'),
+        og_description: meta('meta[property="og:description"]'),
+        og_image: meta('meta[property="og:image"]'),
+        og_url: meta('meta[property="og:url"]'),
+        meta_description: meta('meta[name="description"]'),
+        article_text: article ? article.innerText : null,
+        article_box: rect && rect.width > 0 && rect.height > 0
+            ? { x: rect.x, y: rect.y, width: rect.width, height: rect.height }
+            : null,
+    };
+}"""
+PAGE_META_KEYS = ("title_tag", "og_title", "og_description", "og_image", "og_url", "meta_description")
 
 
 def _playwright_rescue(instagram_url: str) -> Dict[str, Any]:
     try:
-        from playwright.sync_api import sync_playwright
+        import playwright.sync_api  # noqa: F401
     except Exception:
         return {"meta": {}, "caption_text": None, "screenshot_path": None}
+    return run_with_browser(_render_instagram_page, instagram_url)
+
 
+def _render_instagram_page(browser: Any, instagram_url: str) -> Dict[str, Any]:
     screenshot_dir = ensure_storage_path("instagram", "screenshots", is_file=False)
     screenshot_path = screenshot_dir / f"ig_{uuid.uuid4().hex[:8]}.png"
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(
-            headless=True,
-            args=["--no-sandbox", "--disable-dev-shm-usage"],
-        )
-        context = browser.new_context(
-            user_agent=(
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ),
-            locale="de-DE",
-            viewport={"width": 1280, "height": 800},
-        )
+    context = browser.new_context(
+        user_agent=(
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        ),
+        locale="de-DE",
+        viewport={"width": 1280, "height": 800},
+    )
+    try:
         page = context.new_page()
         page.goto(instagram_url, wait_until="domcontentloaded", timeout=45000)
-        page.wait_for_timeout(2500)
-
-        for selector in (
-            "button:has-text('Alle Cookies erlauben')",
-            "button:has-text('Alle akzeptieren')",
-            "button:has-text('Akzeptieren')",
-            "button:has-text('Allow all cookies')",
-            "button:has-text('Accept all')",
-            "button:has-text('Accept')",
-        ):
-            try:
-                locator = page.locator(selector).first
-                if locator.is_visible(timeout=1200):
-                    locator.click(timeout=1200)
-                    page.wait_for_timeout(1500)
-                    break
-            except Exception:
-                continue
-
-        page.wait_for_timeout(3500)
+        # Wait for the post (or at least its meta tags) instead of sleeping a fixed 2.5s.
+        try:
+            page.wait_for_selector(
+                "article, meta[property='og:title']", state="attached", timeout=6000
+            )
+        except Exception:
+            pass
 
+        # One query for every known consent label instead of a browser round-trip per label.
+        try:
+            banner = page.locator("button:visible", has_text=COOKIE_BUTTON_PATTERN).first
+            if banner.count() > 0:
+                banner.click(timeout=1200)
+                page.wait_for_load_state("domcontentloaded")
+        except Exception:
+            pass
+
+        # Let late caption/media requests settle, but never longer than the old fixed sleep.
+        try:
+            page.wait_for_load_state("networkidle", timeout=3500)
+        except Exception:
+            pass
+
+        try:
+            signals = page.evaluate(PAGE_SIGNALS_SCRIPT) or {}
+        except Exception:
+            signals = {}
+        meta = {key: _clean_ws(signals.get(key)) or None for key in PAGE_META_KEYS}
+
+        # Clip to the post itself: OCR cost scales with pixels and the chrome around it is noise.
         screenshot_file: Optional[Path] = None
         try:
-            page.screenshot(path=str(screenshot_path), full_page=False)
+            page.screenshot(path=str(screenshot_path), full_page=False, clip=signals.get("article_box"))
             screenshot_file = screenshot_path
         except Exception:
             screenshot_file = None
 
-        rendered_html = page.content()
-        meta = _html_meta(rendered_html)
-
         caption_texts: List[str] = []
-        try:
-            article = page.locator("article").first
-            if article.count() > 0:
-                text = _clean_ws(article.inner_text())
-                if text:
-                    caption_texts.append(text)
-        except Exception:
-            pass
+        article_text = _clean_ws(signals.get("article_text"))
+        if article_text:
+            caption_texts.append(article_text)
 
         if meta.get("og_description"):
             caption_texts.append(meta["og_description"])
@@ -298,11 +276,10 @@ def _playwright_rescue(instagram_url: str) -> Dict[str, Any]:
                 if cleaned and cleaned not in seen:
                     seen.add(cleaned)
                     dedup.append(cleaned)
-            dedup.sort(key=len, reverse=True)
-            best_caption = dedup[0][:8000] if dedup else None
-
+            # max() keeps the first of equally long captions, as the stable sort did.
+            best_caption = max(dedup, key=len)[:8000] if dedup else None
+    finally:
         context.close()
-        browser.close()
 
     return {
         "meta": meta,
@@ -311,16 +288,40 @@ def _playwright_rescue(instagram_url: str) -> Dict[str, Any]:
     }
 
 
+# Idle libtesseract engines; import workers are short-lived threads, so engines are
+# pooled rather than thread-local to keep the expensive init amortized.
+_tesseract_apis: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+
+
+def _tesserocr_text(image: Any) -> Optional[str]:
+    try:
+        from tesserocr import PyTessBaseAPI
+    except ImportError:
+        return None
+    try:
+        api = _tesseract_apis.get_nowait()
+    except queue.Empty:
+        api = PyTessBaseAPI()
+    try:
+        api.SetImage(image)
+        return api.GetUTF8Text()
+    finally:
+        _tesseract_apis.put(api)
+
+
 def _ocr_from_image(image_path: str) -> str:
     try:
         from PIL import Image
-        import pytesseract
 
-        if not shutil.which("tesseract"):
-            return ""
+        image = Image.open(image_path).convert("L").point(OCR_THRESHOLD_TABLE)
+        text = _tesserocr_text(image)
+        if text is None:
+            # tesserocr is optional; fall back to the tesseract CLI via pytesseract.
+            import pytesseract
 
-        image = Image.open(image_path).convert("L")
-        text = pytesseract.image_to_string(image)
+            if not find_executable("tesseract"):
+                return ""
+            text = pytesseract.image_to_string(image)
         return _clean_ws(text)
     except Exception:
         return ""
@@ -367,14 +368,36 @@ def _openai_recipe_from_signals(
     rescue: dict[str, Any],
     transcript: Optional[str],
     ocr_text: Optional[str] = None,
-) -> tuple[_InstagramRecipe, Dict[str, Any]]:
-    client = get_openai_client()
-
+) -> tuple[_InstagramRecipe, Optional[Dict[str, Any]]]:
     oembed_ok = "_error" not in (oembed or {})
     meta = (rescue or {}).get("meta") or {}
     caption_text = (rescue or {}).get("caption_text") or ""
     ocr_text = ocr_text or ""
 
+    has_signal = bool(
+        oembed_ok
+        or (transcript or "").strip()
+        or caption_text.strip()
+        or ocr_text.strip()
+        or meta.get("og_title")
+        or meta.get("og_description")
+    )
+    if not has_signal:
+        # Nothing for the model to read: skip the call and return the empty placeholder.
+        placeholder = _InstagramRecipe(
+            title="Recipe from Instagram",
+            ingredients=[],
+            steps=[],
+            source_url=instagram_url,
+            source_domain=ensure_domain(instagram_url),
+            extracted_via="no_signals",
+            missing_fields=["title", "ingredients", "steps"],
+            confidence=0.0,
+        )
+        return placeholder, None
+
+    client = get_openai_client()
+
     best_title = (
         (oembed.get("title") if oembed_ok else None)
         or meta.get("og_title")
@@ -403,7 +426,7 @@ def _openai_recipe_from_signals(
             "description_best_effort": best_desc,
             "thumbnail_url_best_effort": thumb,
             "oembed_ok": oembed_ok,
-            "oembed": {k: v for k, v in (oembed or {}).items() if k != "html"},
+            "oembed": oembed or {},
             "meta": meta,
             "caption_text": caption_text,
             "ocr_text": ocr_text,
@@ -415,7 +438,7 @@ def _openai_recipe_from_signals(
         model="gpt-4o-mini",
         input=[
             {"role": "system", "content": system_prompt},
-            {"role": "user", "content": json.dumps(payload, ensure_ascii=False)},
+            {"role": "user", "content": orjson.dumps(payload).decode("utf-8")},
         ],
         text_format=_InstagramRecipe,
     )
@@ -447,10 +470,6 @@ def _openai_recipe_from_signals(
     return recipe, usage_event
 
 
-def _needs_ocr(recipe: _InstagramRecipe) -> bool:
-    return len(recipe.ingredients) == 0 or len(recipe.steps) == 0
-
-
 def _convert_recipe(
     recipe: _InstagramRecipe,
     thumbnail_url: Optional[str],
@@ -462,8 +481,9 @@ def _convert_recipe(
         base_line = clean_text(f"{item.amount or ''} {item.name}".strip())
         if not base_line:
             continue
+        # Already validated by the structured OpenAI parse; skip a second validation pass.
         ingredients.append(
-            ImportedIngredient(
+            ImportedIngredient.model_construct(
                 line=base_line,
                 amount=item.amount,
                 name=item.name,
@@ -498,19 +518,19 @@ def _convert_recipe(
     return converted
 
 
-def import_instagram(url: str) -> Tuple[Dict[str, Any], Optional[str]]:
-    oembed = _fetch_instagram_oembed(url)
-
+def _video_signals(
+    url: str,
+) -> Tuple[Optional[Path], Optional[str], Optional[Dict[str, Any]], Optional[str], Optional[Dict[str, Any]]]:
     transcript: Optional[str] = None
     whisper_event: Optional[Dict[str, Any]] = None
     ocr_text: Optional[str] = None
     ocr_event: Optional[Dict[str, Any]] = None
-    video_path = _download_instagram_video(url)
+    video_path, video_seconds = _download_instagram_video(url)
     if video_path:
-        audio_path = _extract_audio(video_path)
-        if audio_path:
-            transcript = _transcribe_audio(audio_path)
-            audio_seconds = _get_audio_duration_seconds(audio_path)
+        audio, encoded_seconds = _extract_audio(video_path)
+        if audio:
+            transcript = _transcribe_audio(audio)
+            audio_seconds = video_seconds or encoded_seconds
             if audio_seconds:
                 whisper_event = build_usage_event(
                     "openai",
@@ -527,47 +547,55 @@ def import_instagram(url: str) -> Tuple[Dict[str, Any], Optional[str]]:
                     stage="instagram_ocr_frames",
                     extra={"frames": frames_used, "characters": len(ocr_text)},
                 )
+    return video_path, transcript, whisper_event, ocr_text, ocr_event
+
+
+def _rescue_signals(instagram_url: str) -> Tuple[Dict[str, Any], str]:
+    try:
+        rescue = _playwright_rescue(instagram_url)
+    except Exception:
+        rescue = {"meta": {}, "caption_text": None, "screenshot_path": None}
+    # OCR the screenshot here, off the critical path, so one OpenAI call sees every signal.
+    screenshot_path = rescue.get("screenshot_path")
+    screenshot_text = _ocr_from_image(screenshot_path) if screenshot_path else ""
+    return rescue, screenshot_text
+
+
+def import_instagram(url: str) -> Tuple[Dict[str, Any], Optional[str]]:
+    # oEmbed, the video/transcript chain and the Playwright rescue are independent
+    # network-bound stages; run them side by side and join before the OpenAI call.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        oembed_future = executor.submit(_fetch_instagram_oembed, url)
+        video_future = executor.submit(_video_signals, url)
+        rescue_future = executor.submit(_rescue_signals, url)
+        video_path, transcript, whisper_event, ocr_text, ocr_event = video_future.result()
+        oembed = oembed_future.result()
+        rescue, screenshot_text = rescue_future.result()
 
-    rescue = _playwright_rescue(url)
     usage_events: List[Dict[str, Any]] = []
     if whisper_event:
         usage_events.append(whisper_event)
     if ocr_event:
         usage_events.append(ocr_event)
+    if screenshot_text:
+        usage_events.append(
+            build_usage_event(
+                "local-ocr",
+                model="tesseract",
+                stage="instagram_ocr_screenshot",
+                extra={"characters": len(screenshot_text)},
+            )
+        )
+    ocr_parts = [text for text in (ocr_text, screenshot_text[:5000]) if text]
     recipe, usage_event = _openai_recipe_from_signals(
         instagram_url=url,
         oembed=oembed,
         rescue=rescue,
         transcript=transcript,
-        ocr_text=ocr_text,
+        ocr_text="\n".join(ocr_parts) or None,
     )
-    usage_events.append(usage_event)
-
-    screenshot_path = rescue.get("screenshot_path")
-    if _needs_ocr(recipe) and screenshot_path:
-        ocr_text = _ocr_from_image(screenshot_path)
-        if ocr_text:
-            if ocr_event is None:
-                usage_events.append(
-                    build_usage_event(
-                        "local-ocr",
-                        model="tesseract",
-                        stage="instagram_ocr_screenshot",
-                        extra={"characters": len(ocr_text)},
-                    )
-                )
-            recipe_ocr, ocr_event = _openai_recipe_from_signals(
-                instagram_url=url,
-                oembed=oembed,
-                rescue=rescue,
-                transcript=transcript,
-                ocr_text=ocr_text[:5000],
-            )
-            usage_events.append(ocr_event)
-            if (len(recipe_ocr.ingredients) + len(recipe_ocr.steps)) > (
-                len(recipe.ingredients) + len(recipe.steps)
-            ):
-                recipe = recipe_ocr
+    if usage_event:
+        usage_events.append(usage_event)
 
     thumbnail_url = (
         (oembed.get("thumbnail_url") if "_error" not in (oembed or {}) else None)
@@ -1,26 +1,32 @@
 from __future__ import annotations
 
+import html as html_lib
 import json
 import logging
 import re
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import parse_qs, unquote, urljoin, urlparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import unquote, unquote_plus, urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from bs4 import BeautifulSoup, Tag
 
 from .import_utils import (
     ImportedRecipe,
     ensure_domain,
-    extract_json_ld_blocks,
-    extract_og_image,
     fetch_html,
     find_recipe_nodes,
+    get_http_client,
     ingredients_from_strings,
     instructions_from_strings,
+    json_ld_blocks_from_soup,
     normalize_servings,
     pick_best_recipe,
     resolve_schema_image,
+    run_with_browser,
     sync_recipe_media_to_supabase,
 )
 from .import_web import _openai_from_page, _openai_from_pages, _schema_to_recipe
@@ -37,24 +43,153 @@ VISIT_SITE_PATTERNS = [
     "open site",
 ]
 
+VISIT_SITE_PATTERN = re.compile("|".join(map(re.escape, VISIT_SITE_PATTERNS)))
+VISIT_SITE_SELECTOR = "[data-test-id='visit-site-button']"
+# Anchored to the whole label so "Only accept necessary cookies" never matches.
+COOKIE_BUTTON_PATTERN = re.compile(
+    r"^\s*(?:Alle akzeptieren|Akzeptieren|Ich stimme zu|Accept all|Accept)\s*$", re.I
+)
+
 logger = logging.getLogger(__name__)
 
-URL_KEYS = {
-    "link",
-    "url",
-    "destination",
-    "destination_url",
-    "destinationurl",
-    "canonical_url",
-    "canonicalurl",
-    "href",
-    "redirect_url",
-    "redirecturl",
-}
+URL_KEYS = frozenset(
+    {
+        "link",
+        "url",
+        "destination",
+        "destination_url",
+        "destinationurl",
+        "canonical_url",
+        "canonicalurl",
+        "href",
+        "redirect_url",
+        "redirecturl",
+    }
+)
+
+PREFERRED_URL_KEYS = frozenset(
+    {
+        "link",
+        "url",
+        "destinationUrl",
+        "destination_url",
+        "canonicalUrl",
+        "canonical_url",
+        "siteUrl",
+        "externalUrl",
+        "external_url",
+        "targetUrl",
+        "target_url",
+    }
+)
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+PIN_ID_PATTERN = re.compile(r"/pin/(\d+)")
+HEAD_END_PATTERN = re.compile(r"</head\s*>", re.I)
+# Comments and script bodies are matched only so that the <meta> scan skips over them.
+META_TAG_PATTERN = re.compile(
+    r"""<!--.*?-->|<script\b.*?</script\s*>|<meta\b((?:[^>"']|"[^"]*"|'[^']*')*)>""", re.I | re.S
+)
+TAG_ATTR_PATTERN = re.compile(r"""([^\s=/>]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""")
+CANONICAL_REL_PATTERN = re.compile(r"\bcanonical\b", re.I)
+JSON_TYPE_PATTERN = re.compile(r"json", re.I)
+JSON_CONTAINER_PATTERN = re.compile(r"(\{.*\}|\[.*\])", re.DOTALL)
+# Jumps from any PWS marker straight to the first object/array opener after it.
+PWS_MARKER_PATTERN = re.compile(r"(?:__PWS_DATA__|__PWS_INITIAL_PROPS__|__PWS_INITIAL_STATE__)[^{\[]*([{\[])")
+JSON_OPENER_PATTERN = re.compile(r"[{\[]")
+OUTGOING_URL_PARAM_PATTERN = re.compile(r"(?:^|&)url=([^&]+)")
+JSON_URL_ESCAPE_PATTERN = re.compile(r"\\/|\\u([0-9a-fA-F]{4})")
+URL_SCAN_PATTERN = re.compile(r"https?://[^\s'\"]+")
+RAW_JSON_URL_PATTERN = re.compile(r'"(?P<key>tracked_link|link|url)"\s*:\s*"(?P<url>[^"]+)"')
+PIN_WINDOW_RADIUS = 20000
+JSON_DECODER = json.JSONDecoder()
+# Highest value _pinterest_node_score can return.
+PIN_NODE_MAX_SCORE = 14
+# The browser sniff is only a fallback: allow its own goto + selector + networkidle budget
+# (about 55s) rather than the longer default wait for a shared browser slot.
+PIN_SNIFF_TIMEOUT_SECONDS = 60.0
+# _recipe_quality_score points an OpenAI pick must lead every schema candidate by to
+# justify re-asking OpenAI with secondary-page context.
+SCHEMA_SCORE_MARGIN = 3
+
+
+@lru_cache(maxsize=None)
+def _soup_parser() -> str:
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+def _parse_html(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, _soup_parser())
+
+
+@dataclass
+class ParsedPage:
+    """A fetched page parsed once and shared by every extraction helper."""
+
+    html: str
+    soup: BeautifulSoup
+
+    @classmethod
+    def from_html(cls, html: str) -> "ParsedPage":
+        return cls(html=html, soup=_parse_html(html))
+
+    @cached_property
+    def anchors(self) -> List[Tag]:
+        return self.soup.find_all("a", href=True)
+
+    @cached_property
+    def scripts(self) -> List[Tag]:
+        return self.soup.find_all("script")
+
+    @cached_property
+    def pws_data(self) -> Optional[Any]:
+        script = self.script_by_id("__PWS_DATA__")
+        return _try_json_load(_script_text(script)) if script else None
+
+    def script_by_id(self, script_id: str) -> Optional[Tag]:
+        for script in self.scripts:
+            if script.get("id") == script_id:
+                return script
+        return None
+
+    @cached_property
+    def head_meta(self) -> Dict[str, str]:
+        """property -> raw content of the first <meta property> of each kind in <head>."""
+        head_end = HEAD_END_PATTERN.search(self.html)
+        head = self.html[: head_end.start()] if head_end else self.html
+        found: Dict[str, str] = {}
+        for tag in META_TAG_PATTERN.finditer(head):
+            if tag.group(1) is None:
+                continue
+            attrs: Dict[str, str] = {}
+            for attr in TAG_ATTR_PATTERN.finditer(tag.group(1)):
+                name = attr.group(1).lower()
+                if name not in attrs:
+                    value = attr.group(2) if attr.group(2) is not None else attr.group(3)
+                    attrs[name] = value if value is not None else attr.group(4)
+            prop = attrs.get("property")
+            if prop is not None:
+                found.setdefault(html_lib.unescape(prop), html_lib.unescape(attrs.get("content", "")))
+        return found
+
+    def meta_property(self, prop: str) -> Optional[str]:
+        if prop in self.head_meta:
+            return self.head_meta[prop] or None
+        meta = self.soup.find("meta", attrs={"property": prop})
+        return (meta.get("content") or None) if meta else None
+
+
+def _script_text(script: Tag) -> str:
+    # orjson only accepts exact str instances, not bs4's NavigableString subclass.
+    return str(script.string or script.get_text())
 
 
 def _clean_ws(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "")).strip()
+    return WHITESPACE_PATTERN.sub(" ", (text or "")).strip()
 
 
 def _normalize_url(url: str) -> str:
@@ -64,115 +199,109 @@ def _normalize_url(url: str) -> str:
     return url
 
 
-def _is_http_url(url: Optional[str]) -> bool:
-    if not url:
-        return False
+class _UrlInfo(NamedTuple):
+    is_http: bool
+    is_external: bool
+    host: str
+
+
+@lru_cache(maxsize=4096)
+def _classify_url(url: str) -> _UrlInfo:
+    # Pin payloads repeat the same URLs many times; parse each distinct string once.
     try:
-        return urlparse(url).scheme in ("http", "https")
-    except Exception:
-        return False
+        parsed = urlparse(url)
+    except ValueError:
+        return _UrlInfo(False, False, "")
+    host = parsed.netloc.lower()
+    is_external = bool(host) and "pinterest." not in host and "pinimg." not in host and "pin.it" not in host
+    return _UrlInfo(parsed.scheme in ("http", "https"), is_external, host)
 
 
 def _is_external_non_pinterest(url: str) -> bool:
-    host = urlparse(url).netloc.lower()
-    return host and "pinterest." not in host and "pinimg." not in host and "pin.it" not in host
+    return _classify_url(url).is_external
 
 
-def _extract_og_url(html: str) -> Optional[str]:
-    soup = BeautifulSoup(html, "html.parser")
-    og = soup.find("meta", attrs={"property": "og:url"})
-    if og and og.get("content"):
-        return og["content"].strip()
-    return None
+def _is_external_http_url(url: Optional[str]) -> bool:
+    if not url:
+        return False
+    info = _classify_url(url)
+    return info.is_http and info.is_external
 
 
-def _extract_og_title(html: str) -> Optional[str]:
-    soup = BeautifulSoup(html, "html.parser")
-    og = soup.find("meta", attrs={"property": "og:title"})
-    if og and og.get("content"):
-        return _clean_ws(og["content"])
-    return None
+def _extract_og_url(page: ParsedPage) -> Optional[str]:
+    content = page.meta_property("og:url")
+    return content.strip() if content else None
 
 
-def _extract_og_description(html: str) -> Optional[str]:
-    soup = BeautifulSoup(html, "html.parser")
-    og = soup.find("meta", attrs={"property": "og:description"})
-    if og and og.get("content"):
-        return _clean_ws(og["content"])
-    return None
+def _extract_og_title(page: ParsedPage) -> Optional[str]:
+    content = page.meta_property("og:title")
+    return _clean_ws(content) if content else None
+
+
+def _extract_og_description(page: ParsedPage) -> Optional[str]:
+    content = page.meta_property("og:description")
+    return _clean_ws(content) if content else None
+
+
+def _extract_og_image(page: ParsedPage) -> Optional[str]:
+    content = page.meta_property("og:image")
+    return content.strip() if content else None
 
 
-def _extract_canonical_url(html: str, base_url: str) -> Optional[str]:
-    soup = BeautifulSoup(html, "html.parser")
-    link = soup.find("link", attrs={"rel": re.compile(r"\\bcanonical\\b", re.I)})
+def _extract_canonical_url(page: ParsedPage, base_url: str) -> Optional[str]:
+    link = page.soup.find("link", attrs={"rel": CANONICAL_REL_PATTERN})
     if link and link.get("href"):
         return urljoin(base_url, link["href"].strip())
     return None
 
 
 def _extract_outgoing_url(url: str) -> Optional[str]:
-    if "outgoing" not in url or "url=" not in url:
+    if "outgoing" not in url:
         return None
-    qs = parse_qs(urlparse(url).query)
-    if "url" in qs and qs["url"]:
-        return unquote(qs["url"][0])
-    return None
+    # Same result as parse_qs(urlparse(url).query)["url"][0], without building either.
+    query = url.partition("#")[0].partition("?")[2]
+    match = OUTGOING_URL_PARAM_PATTERN.search(query)
+    if not match:
+        return None
+    return unquote(unquote_plus(match.group(1)))
+
+
+def _unescape_json_url_match(match: re.Match[str]) -> str:
+    code = match.group(1)
+    return chr(int(code, 16)) if code else "/"
 
 
 def _decode_escaped_url(url: str) -> str:
-    cleaned = url.replace("\\/", "/")
-    if "\\u" in cleaned:
-        try:
-            return cleaned.encode("utf-8").decode("unicode_escape")
-        except UnicodeDecodeError:
-            return cleaned
-    return cleaned
-
-
-def _extract_url_from_raw_json(raw: str) -> Optional[str]:
-    patterns = [
-        r'"tracked_link"\s*:\s*"(?P<url>[^"]+)"',
-        r'"link"\s*:\s*"(?P<url>[^"]+)"',
-        r'"url"\s*:\s*"(?P<url>[^"]+)"',
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, raw)
-        if not match:
+    if "\\" not in url:
+        return url
+    return JSON_URL_ESCAPE_PATTERN.sub(_unescape_json_url_match, url)
+
+
+def _extract_url_from_raw_json(raw: str, pos: int = 0, endpos: Optional[int] = None) -> Optional[str]:
+    # One scan for all keys; tracked_link wins outright, then link, then url.
+    fallbacks: Dict[str, str] = {}
+    for match in RAW_JSON_URL_PATTERN.finditer(raw, pos, len(raw) if endpos is None else endpos):
+        key = match.group("key")
+        if key in fallbacks:
             continue
         candidate = _decode_escaped_url(match.group("url"))
-        if _is_http_url(candidate) and _is_external_non_pinterest(candidate):
+        if not _is_external_http_url(candidate):
+            continue
+        if key == "tracked_link":
             return candidate
-    return None
+        fallbacks[key] = candidate
+    return fallbacks.get("link") or fallbacks.get("url")
 
 
-def _extract_json_blob(text: str, start_index: int) -> Optional[str]:
-    opener = text[start_index]
-    if opener not in "{[":
+def _decode_json_at(text: str, start_index: int) -> Optional[Any]:
+    # raw_decode finds the end of the value in C, so the blob is located and parsed in one pass.
+    if text[start_index] not in "{[":
         return None
-    closer = "}" if opener == "{" else "]"
-    depth = 0
-    in_string = False
-    escape = False
-    for idx in range(start_index, len(text)):
-        ch = text[idx]
-        if in_string:
-            if escape:
-                escape = False
-            elif ch == "\\":
-                escape = True
-            elif ch == '"':
-                in_string = False
-            continue
-        if ch == '"':
-            in_string = True
-            continue
-        if ch == opener:
-            depth += 1
-        elif ch == closer:
-            depth -= 1
-            if depth == 0:
-                return text[start_index : idx + 1]
-    return None
+    try:
+        value, _ = JSON_DECODER.raw_decode(text, start_index)
+    except json.JSONDecodeError:
+        return None
+    return value
 
 
 def _extract_json_from_script(raw: str) -> List[Any]:
@@ -180,190 +309,147 @@ def _extract_json_from_script(raw: str) -> List[Any]:
     if not raw:
         return []
     try:
-        return [json.loads(raw)]
-    except json.JSONDecodeError:
+        return [orjson.loads(raw)]
+    except orjson.JSONDecodeError:
         pass
 
-    for marker in ("__PWS_DATA__", "__PWS_INITIAL_PROPS__", "__PWS_INITIAL_STATE__"):
-        marker_index = raw.find(marker)
-        if marker_index == -1:
-            continue
-        brace_index = raw.find("{", marker_index)
-        array_index = raw.find("[", marker_index)
-        start_index = min(
-            idx for idx in (brace_index, array_index) if idx != -1
-        ) if brace_index != -1 or array_index != -1 else -1
-        if start_index == -1:
-            continue
-        blob = _extract_json_blob(raw, start_index)
-        if not blob:
-            continue
-        try:
-            return [json.loads(blob)]
-        except json.JSONDecodeError:
-            continue
+    for match in PWS_MARKER_PATTERN.finditer(raw):
+        value = _decode_json_at(raw, match.start(1))
+        if value is not None:
+            return [value]
 
-    first_brace = raw.find("{")
-    first_bracket = raw.find("[")
-    start_index = min(
-        idx for idx in (first_brace, first_bracket) if idx != -1
-    ) if first_brace != -1 or first_bracket != -1 else -1
-    if start_index != -1:
-        blob = _extract_json_blob(raw, start_index)
-        if blob:
-            try:
-                return [json.loads(blob)]
-            except json.JSONDecodeError:
-                pass
+    match = JSON_OPENER_PATTERN.search(raw)
+    if match:
+        value = _decode_json_at(raw, match.start())
+        if value is not None:
+            return [value]
     return []
 
 
 def _collect_external_urls(value: Any) -> List[str]:
     urls: List[str] = []
-    preferred_keys = {
-        "link",
-        "url",
-        "destinationUrl",
-        "destination_url",
-        "canonicalUrl",
-        "canonical_url",
-        "siteUrl",
-        "externalUrl",
-        "external_url",
-        "targetUrl",
-        "target_url",
-    }
-
-    if isinstance(value, dict):
-        for key in preferred_keys:
-            if key in value:
-                urls.extend(_collect_external_urls(value[key]))
-        for item in value.values():
-            urls.extend(_collect_external_urls(item))
-        return urls
-    if isinstance(value, list):
-        for item in value:
-            urls.extend(_collect_external_urls(item))
-        return urls
-    if isinstance(value, str):
-        candidate = _normalize_url(value)
-        outgoing = _extract_outgoing_url(candidate)
-        if outgoing:
-            urls.append(outgoing)
-            return urls
-        if candidate.startswith("http") and _is_external_non_pinterest(candidate):
-            urls.append(candidate)
-        return urls
+    stack: List[Any] = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            # Preferred keys are walked first (in dict order); every value is walked once.
+            preferred: List[Any] = []
+            rest: List[Any] = []
+            for key, child in item.items():
+                (preferred if key in PREFERRED_URL_KEYS else rest).append(child)
+            stack.extend(reversed(preferred + rest))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
+        elif isinstance(item, str):
+            candidate = _normalize_url(item)
+            outgoing = _extract_outgoing_url(candidate)
+            if outgoing:
+                urls.append(outgoing)
+            elif candidate.startswith("http") and _is_external_non_pinterest(candidate):
+                urls.append(candidate)
     return urls
 
 
 def _deep_find_external_url(value: Any) -> Optional[str]:
-    if isinstance(value, dict):
-        for key, item in value.items():
-            key_lower = str(key).lower()
-            if key_lower in URL_KEYS and isinstance(item, str):
+    stack: List[Tuple[Any, Any]] = [(None, value)]
+    while stack:
+        key, item = stack.pop()
+        if isinstance(item, str):
+            if key is not None and str(key).lower() in URL_KEYS:
                 candidate = _decode_escaped_url(item)
                 candidate = _normalize_url(candidate)
                 outgoing = _extract_outgoing_url(candidate)
                 if outgoing:
                     candidate = outgoing
-                if _is_http_url(candidate) and _is_external_non_pinterest(candidate):
+                if _is_external_http_url(candidate):
                     return candidate
-            found = _deep_find_external_url(item)
-            if found:
-                return found
-    elif isinstance(value, list):
-        for item in value:
-            found = _deep_find_external_url(item)
-            if found:
-                return found
+        elif isinstance(item, dict):
+            stack.extend(reversed(list(item.items())))
+        elif isinstance(item, list):
+            stack.extend((None, child) for child in reversed(item))
     return None
 
 
-def _sniff_pin_destination_with_playwright(pin_url: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+def _sniff_pin_destination_with_playwright(pin_url: str) -> Tuple[Optional[str], Optional[str]]:
     try:
-        from playwright.sync_api import sync_playwright
+        import playwright.sync_api  # noqa: F401
     except Exception:
         logger.info("Playwright is not available; skipping Pinterest sniff.")
-        return None, None, None
+        return None, None
 
+    try:
+        rendered_html, dest_candidates = run_with_browser(_render_pin_page, pin_url, timeout=PIN_SNIFF_TIMEOUT_SECONDS)
+    except Exception as exc:
+        logger.warning("Pinterest Playwright sniff failed: %s", exc)
+        return None, None
+
+    return rendered_html, dest_candidates[0] if dest_candidates else None
+
+
+def _render_pin_page(browser: Any, pin_url: str) -> Tuple[Optional[str], List[str]]:
     dest_candidates: List[str] = []
-    rendered_html: Optional[str] = None
-    og_image: Optional[str] = None
 
     def add_candidate(candidate: str) -> None:
         normalized = _normalize_url(candidate)
         outgoing = _extract_outgoing_url(normalized)
         if outgoing:
             normalized = outgoing
-        if _is_http_url(normalized) and _is_external_non_pinterest(normalized):
+        if _is_external_http_url(normalized):
             if normalized not in dest_candidates:
                 dest_candidates.append(normalized)
 
+    context = browser.new_context(
+        user_agent=(
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        ),
+        locale="de-DE",
+        viewport={"width": 1280, "height": 800},
+    )
     try:
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(
-                headless=True,
-                args=["--no-sandbox", "--disable-dev-shm-usage"],
-            )
-            context = browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                ),
-                locale="de-DE",
-                viewport={"width": 1280, "height": 800},
-            )
-            page = context.new_page()
-
-            def handle_response(response) -> None:
-                try:
-                    content_type = (response.headers.get("content-type") or "").lower()
-                    if "application/json" not in content_type and "text/json" not in content_type:
-                        return
-                    if response.request.resource_type not in ("xhr", "fetch"):
-                        return
-                    data = response.json()
-                    found = _deep_find_external_url(data)
-                    if found:
-                        add_candidate(found)
-                except Exception:
+        page = context.new_page()
+
+        def handle_response(response) -> None:
+            try:
+                content_type = (response.headers.get("content-type") or "").lower()
+                if "application/json" not in content_type and "text/json" not in content_type:
+                    return
+                if response.request.resource_type not in ("xhr", "fetch"):
                     return
+                data = orjson.loads(response.body())
+                found = _deep_find_external_url(data)
+                if found:
+                    add_candidate(found)
+            except Exception:
+                return
 
-            page.on("response", handle_response)
-            page.goto(pin_url, wait_until="domcontentloaded", timeout=45000)
-            page.wait_for_timeout(2500)
+        page.on("response", handle_response)
+        page.goto(pin_url, wait_until="domcontentloaded", timeout=45000)
+        # Wait for the pin's visit button instead of sleeping a fixed 2.5s.
+        try:
+            page.wait_for_selector(VISIT_SITE_SELECTOR, state="attached", timeout=5000)
+        except Exception:
+            pass
 
-            for selector in (
-                "button:has-text('Alle akzeptieren')",
-                "button:has-text('Akzeptieren')",
-                "button:has-text('Ich stimme zu')",
-                "button:has-text('Accept all')",
-                "button:has-text('Accept')",
-            ):
-                try:
-                    locator = page.locator(selector).first
-                    if locator.is_visible(timeout=1200):
-                        locator.click(timeout=1200)
-                        page.wait_for_timeout(1500)
-                        break
-                except Exception:
-                    continue
-
-            page.wait_for_timeout(4000)
-            rendered_html = page.content()
-            if rendered_html:
-                og_image = extract_og_image(rendered_html)
-
-            context.close()
-            browser.close()
-    except Exception as exc:
-        logger.warning("Pinterest Playwright sniff failed: %s", exc)
-        return None, None, None
+        try:
+            banner = page.locator("button:visible", has_text=COOKIE_BUTTON_PATTERN).first
+            if banner.count() > 0:
+                banner.click(timeout=1200)
+                page.wait_for_load_state("domcontentloaded")
+        except Exception:
+            pass
+
+        # Destination links mostly arrive via XHR; let them settle, capped below the old 4s sleep.
+        try:
+            page.wait_for_load_state("networkidle", timeout=3500)
+        except Exception:
+            pass
 
-    if dest_candidates:
-        return rendered_html, dest_candidates[0], og_image
-    return rendered_html, None, og_image
+        rendered_html = page.content()
+    finally:
+        context.close()
+
+    return rendered_html, dest_candidates
 
 
 def _try_json_load(raw: str) -> Optional[Any]:
@@ -371,55 +457,57 @@ def _try_json_load(raw: str) -> Optional[Any]:
     if not raw:
         return None
     try:
-        return json.loads(raw)
+        return orjson.loads(raw)
     except Exception:
-        match = re.search(r"(\\{.*\\}|\\[.*\\])", raw, flags=re.DOTALL)
+        match = JSON_CONTAINER_PATTERN.search(raw)
         if match:
             try:
-                return json.loads(match.group(1))
+                return orjson.loads(match.group(1))
             except Exception:
                 return None
     return None
 
 
-def _collect_json_blobs_from_html(html: str) -> List[Any]:
-    soup = BeautifulSoup(html, "html.parser")
-    blobs: List[Any] = []
-    pws = soup.find("script", attrs={"id": "__PWS_DATA__"})
-    if pws:
-        data = _try_json_load(pws.string or pws.get_text())
-        if data is not None:
-            blobs.append(data)
-    return blobs
-
+def _collect_json_blobs_from_page(page: ParsedPage) -> List[Any]:
+    return [page.pws_data] if page.pws_data is not None else []
 
-def _find_recipe_like_nodes(value: Any) -> List[dict[str, Any]]:
-    nodes: List[dict[str, Any]] = []
 
-    def walk(item: Any) -> None:
+def _iter_recipe_like_nodes(value: Any) -> Iterator[dict[str, Any]]:
+    stack: List[Any] = [value]
+    while stack:
+        item = stack.pop()
         if isinstance(item, dict):
             node_type = item.get("@type")
             if isinstance(node_type, str) and node_type.lower() == "recipe":
-                nodes.append(item)
+                yield item
             elif isinstance(node_type, list) and any(
                 isinstance(entry, str) and entry.lower() == "recipe" for entry in node_type
             ):
-                nodes.append(item)
+                yield item
 
             has_ingredients = "recipeIngredient" in item or "ingredients" in item
             has_instructions = "recipeInstructions" in item or "instructions" in item
             has_title = "name" in item or "title" in item
             if (has_ingredients or has_instructions) and has_title:
-                nodes.append(item)
+                yield item
 
-            for child in item.values():
-                walk(child)
+            stack.extend(reversed(list(item.values())))
         elif isinstance(item, list):
-            for child in item:
-                walk(child)
+            stack.extend(reversed(item))
 
-    walk(value)
-    return nodes
+
+def _best_recipe_like_node(value: Any) -> Optional[dict[str, Any]]:
+    # Same pick as max(nodes, key=_pinterest_node_score), but the walk stops at the
+    # first node with the top possible score instead of visiting the whole blob.
+    best_node: Optional[dict[str, Any]] = None
+    best_score = -1
+    for node in _iter_recipe_like_nodes(value):
+        score = _pinterest_node_score(node)
+        if score > best_score:
+            best_node, best_score = node, score
+            if score >= PIN_NODE_MAX_SCORE:
+                break
+    return best_node
 
 
 def _pinterest_node_score(node: dict[str, Any]) -> int:
@@ -464,9 +552,9 @@ def _extract_instructions_from_any(value: Any) -> List[str]:
     return items
 
 
-def _pinterest_extract_recipe(pin_html: str, pin_url: str, pin_image: Optional[str]) -> ImportedRecipe:
-    title = _extract_og_title(pin_html) or "Imported Recipe"
-    description = _extract_og_description(pin_html)
+def _pinterest_extract_recipe(pin_page: ParsedPage, pin_url: str, pin_image: Optional[str]) -> ImportedRecipe:
+    title = _extract_og_title(pin_page) or "Imported Recipe"
+    description = _extract_og_description(pin_page)
 
     recipe = ImportedRecipe(
         title=title,
@@ -481,10 +569,9 @@ def _pinterest_extract_recipe(pin_html: str, pin_url: str, pin_image: Optional[s
     )
 
     best_node: Optional[dict[str, Any]] = None
-    for blob in _collect_json_blobs_from_html(pin_html):
-        nodes = _find_recipe_like_nodes(blob)
-        if nodes:
-            best_node = sorted(nodes, key=_pinterest_node_score, reverse=True)[0]
+    for blob in _collect_json_blobs_from_page(pin_page):
+        best_node = _best_recipe_like_node(blob)
+        if best_node is not None:
             break
 
     if not best_node:
@@ -534,74 +621,88 @@ def _enrich_pinterest_with_openai_if_needed(
         extracted_via_label="openai_from_pinterest_pin",
     )
 
-    merged = base_recipe.model_copy(deep=True)
-    for field in ("title", "description", "prep_time", "cook_time", "total_time", "servings"):
-        if not getattr(merged, field) and getattr(ai_recipe, field):
-            setattr(merged, field, getattr(ai_recipe, field))
-
-    if not merged.ingredients and ai_recipe.ingredients:
-        merged.ingredients = ai_recipe.ingredients
-    if not merged.instructions and ai_recipe.instructions:
-        merged.instructions = ai_recipe.instructions
-
-    merged.extracted_via = f"{merged.extracted_via}+openai_enrich"
-    merged.media_image_url = merged.media_image_url or ai_recipe.media_image_url or pin_image
-    return merged
-
-
-def _extract_destination_url_from_json(pin_html: str) -> Optional[str]:
-    soup = BeautifulSoup(pin_html, "html.parser")
-    for script in soup.find_all("script"):
-        if script.get("type") and not re.search(r"json", script["type"], re.I):
+    overrides: Dict[str, Any] = {
+        field: getattr(ai_recipe, field)
+        for field in ("title", "description", "prep_time", "cook_time", "total_time", "servings")
+        if not getattr(base_recipe, field) and getattr(ai_recipe, field)
+    }
+    if not base_recipe.ingredients and ai_recipe.ingredients:
+        overrides["ingredients"] = ai_recipe.ingredients
+    if not base_recipe.instructions and ai_recipe.instructions:
+        overrides["instructions"] = ai_recipe.instructions
+
+    overrides["extracted_via"] = f"{base_recipe.extracted_via}+openai_enrich"
+    overrides["media_image_url"] = base_recipe.media_image_url or ai_recipe.media_image_url or pin_image
+    # The caller replaces base_recipe with the result, so a shallow copy is enough.
+    return base_recipe.model_copy(update=overrides)
+
+
+def _iter_page_json(pin_page: ParsedPage) -> Iterator[Any]:
+    # __PWS_DATA__ carries the pin itself and is decoded once per page (the recipe
+    # extraction reuses it), so it goes first and is not decoded again below.
+    pws_data = pin_page.pws_data
+    if pws_data is not None:
+        yield pws_data
+    for script in pin_page.scripts:
+        if pws_data is not None and script.get("id") == "__PWS_DATA__":
             continue
-        raw = script.string or script.get_text()
-        if not raw:
+        if script.get("type") and not JSON_TYPE_PATTERN.search(script["type"]):
             continue
-        for parsed in _extract_json_from_script(raw):
-            for url in _collect_external_urls(parsed):
-                if _is_http_url(url) and _is_external_non_pinterest(url):
-                    return url
+        raw = _script_text(script)
+        if raw:
+            yield from _extract_json_from_script(raw)
+
+
+def _extract_destination_url_from_json(pin_page: ParsedPage) -> Optional[str]:
+    for parsed in _iter_page_json(pin_page):
+        for url in _collect_external_urls(parsed):
+            if _is_external_http_url(url):
+                return url
     return None
 
 
 def _extract_pin_id(url: str) -> Optional[str]:
-    match = re.search(r"/pin/(\d+)", url)
+    match = PIN_ID_PATTERN.search(url)
     if match:
         return match.group(1)
     return None
 
 
 def _find_pin_payload(data: Any, pin_id: str) -> Optional[dict[str, Any]]:
-    if isinstance(data, dict):
-        if pin_id in data and isinstance(data.get(pin_id), dict):
-            return data.get(pin_id)
-        for value in data.values():
-            found = _find_pin_payload(value, pin_id)
-            if found:
-                return found
-    elif isinstance(data, list):
-        for item in data:
-            found = _find_pin_payload(item, pin_id)
-            if found:
-                return found
+    stack: List[Any] = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            if pin_id in item and isinstance(item.get(pin_id), dict):
+                if item[pin_id]:
+                    return item[pin_id]
+                continue
+            stack.extend(reversed(list(item.values())))
+        elif isinstance(item, list):
+            stack.extend(reversed(item))
     return None
 
 
-def _extract_destination_url_from_pws_props(pin_html: str, pin_id: str) -> Optional[str]:
-    soup = BeautifulSoup(pin_html, "html.parser")
-    script = soup.find("script", attrs={"id": "__PWS_INITIAL_PROPS__"})
+def _extract_destination_url_from_pws_props(pin_page: ParsedPage, pin_id: str) -> Optional[str]:
+    script = pin_page.script_by_id("__PWS_INITIAL_PROPS__")
     if not script:
         return None
-    raw = script.string or script.get_text()
+    raw = _script_text(script)
     if not raw:
         return None
+
+    for pin_object in _iter_pin_objects(raw, pin_id):
+        url = _extract_url_from_pin_payload(pin_object)
+        if url:
+            return url
+
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         return _extract_url_from_raw_json(raw)
 
-    state = data.get("initialReduxState") if isinstance(data, dict) else None
     pin_payload = None
+    state = data.get("initialReduxState") if isinstance(data, dict) else None
     if isinstance(state, dict):
         pins = state.get("pins")
         if isinstance(pins, dict) and pin_id in pins and isinstance(pins[pin_id], dict):
@@ -611,31 +712,17 @@ def _extract_destination_url_from_pws_props(pin_html: str, pin_id: str) -> Optio
 
     if not isinstance(pin_payload, dict):
         return None
+    return _extract_url_from_pin_payload(pin_payload)
 
-    for key in ("tracked_link", "link"):
-        candidate = pin_payload.get(key)
-        if isinstance(candidate, str):
-            candidate = _decode_escaped_url(candidate)
-            if _is_http_url(candidate) and _is_external_non_pinterest(candidate):
-                return candidate
 
-    rich_metadata = pin_payload.get("rich_metadata")
-    if isinstance(rich_metadata, dict):
-        candidate = rich_metadata.get("url")
-        if isinstance(candidate, str):
-            candidate = _decode_escaped_url(candidate)
-            if _is_http_url(candidate) and _is_external_non_pinterest(candidate):
-                return candidate
-
-    rich_summary = pin_payload.get("rich_summary")
-    if isinstance(rich_summary, dict):
-        candidate = rich_summary.get("url")
-        if isinstance(candidate, str):
-            candidate = _decode_escaped_url(candidate)
-            if _is_http_url(candidate) and _is_external_non_pinterest(candidate):
-                return candidate
-
-    return None
+def _iter_pin_objects(raw: str, pin_id: str) -> Iterator[dict[str, Any]]:
+    # The props blob is mostly unrelated Redux state; decode only the pin's own objects.
+    # The same pin can appear several times (e.g. a stub in a feed), so yield every match.
+    key_pattern = re.compile(r'"%s"\s*:\s*\{' % re.escape(pin_id))
+    for match in key_pattern.finditer(raw):
+        value = _decode_json_at(raw, match.end() - 1)
+        if isinstance(value, dict) and str(value.get("id")) == pin_id:
+            yield value
 
 
 def _extract_url_from_pin_payload(payload: dict[str, Any]) -> Optional[str]:
@@ -643,7 +730,7 @@ def _extract_url_from_pin_payload(payload: dict[str, Any]) -> Optional[str]:
         candidate = payload.get(key)
         if isinstance(candidate, str):
             candidate = _decode_escaped_url(candidate)
-            if _is_http_url(candidate) and _is_external_non_pinterest(candidate):
+            if _is_external_http_url(candidate):
                 return candidate
 
     for container_key in ("rich_metadata", "rich_summary"):
@@ -652,7 +739,7 @@ def _extract_url_from_pin_payload(payload: dict[str, Any]) -> Optional[str]:
             candidate = container.get("url")
             if isinstance(candidate, str):
                 candidate = _decode_escaped_url(candidate)
-                if _is_http_url(candidate) and _is_external_non_pinterest(candidate):
+                if _is_external_http_url(candidate):
                     return candidate
     return None
 
@@ -665,22 +752,13 @@ def _fetch_pin_resource_url(pin_id: str) -> Optional[str]:
     }
     params = {
         "source_url": f"/pin/{pin_id}/",
-        "data": json.dumps(data, separators=(",", ":")),
-    }
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept-Language": "de,en;q=0.8",
+        "data": orjson.dumps(data).decode("utf-8"),
     }
     try:
-        with httpx.Client(headers=headers, timeout=30.0, follow_redirects=True) as client:
-            response = client.get(endpoint, params=params)
-            response.raise_for_status()
-            payload = response.json()
-    except (httpx.HTTPError, json.JSONDecodeError):
+        response = get_http_client().get(endpoint, params=params)
+        response.raise_for_status()
+        payload = orjson.loads(response.content)
+    except (httpx.HTTPError, orjson.JSONDecodeError):
         return None
 
     data_payload = None
@@ -700,32 +778,34 @@ def _extract_destination_url_from_pin_window(pin_html: str, pin_id: str) -> Opti
     index = pin_html.find(pin_id)
     if index == -1:
         return None
-    start = max(0, index - 20000)
-    end = min(len(pin_html), index + 20000)
-    window = pin_html[start:end]
-    return _extract_url_from_raw_json(window)
+    start = max(0, index - PIN_WINDOW_RADIUS)
+    end = min(len(pin_html), index + PIN_WINDOW_RADIUS)
+    return _extract_url_from_raw_json(pin_html, start, end)
 
 
-def _extract_destination_url(pin_html: str, pin_id: Optional[str] = None) -> Optional[str]:
-    soup = BeautifulSoup(pin_html, "html.parser")
-    for link in soup.find_all("a", href=True):
+def _extract_destination_url(pin_page: ParsedPage, pin_id: Optional[str] = None) -> Optional[str]:
+    pin_html = pin_page.html
+    # One pass over the anchors; the outgoing and plain external links are kept as later fallbacks.
+    outgoing_link: Optional[str] = None
+    external_link: Optional[str] = None
+    for link in pin_page.anchors:
+        href = _normalize_url(link["href"])
         text = _clean_ws(link.get_text(" ", strip=True)).lower()
-        if any(pattern in text for pattern in VISIT_SITE_PATTERNS):
-            href = _normalize_url(link["href"])
-            if _is_http_url(href) and _is_external_non_pinterest(href):
-                return href
-    for link in soup.find_all("a", href=True):
-        href = link["href"]
-        outgoing = _extract_outgoing_url(href)
-        if outgoing:
-            return outgoing
-
-    json_candidate = _extract_destination_url_from_json(pin_html)
+        if VISIT_SITE_PATTERN.search(text) and _is_external_http_url(href):
+            return href
+        if outgoing_link is None:
+            outgoing_link = _extract_outgoing_url(link["href"])
+        if external_link is None and href.startswith("http") and _is_external_non_pinterest(href):
+            external_link = href
+    if outgoing_link:
+        return outgoing_link
+
+    json_candidate = _extract_destination_url_from_json(pin_page)
     if json_candidate:
         return json_candidate
 
     if pin_id:
-        pin_candidate = _extract_destination_url_from_pws_props(pin_html, pin_id)
+        pin_candidate = _extract_destination_url_from_pws_props(pin_page, pin_id)
         if pin_candidate:
             return pin_candidate
         window_candidate = _extract_destination_url_from_pin_window(pin_html, pin_id)
@@ -736,54 +816,47 @@ def _extract_destination_url(pin_html: str, pin_id: Optional[str] = None) -> Opt
     if raw_candidate:
         return raw_candidate
 
-    for match in re.finditer(r"https?://[^\\s'\\\"]+", pin_html):
+    for match in URL_SCAN_PATTERN.finditer(pin_html):
         outgoing = _extract_outgoing_url(match.group(0))
         if outgoing:
             return outgoing
 
-    external_links: List[str] = []
-    for link in soup.find_all("a", href=True):
-        href = _normalize_url(link["href"])
-        if href.startswith("http") and _is_external_non_pinterest(href):
-            external_links.append(href)
-    return external_links[0] if external_links else None
+    return external_link
 
 
-def _extract_visit_website_url(dest_html: str, dest_url: str) -> Optional[str]:
-    soup = BeautifulSoup(dest_html, "html.parser")
+def _extract_visit_website_url(dest_page: ParsedPage, dest_url: str) -> Optional[str]:
+    soup = dest_page.soup
 
     container = soup.find(attrs={"data-test-id": "visit-site-button"})
     if container:
         anchor = container.find("a", href=True)
         if anchor and anchor.get("href"):
             href = urljoin(dest_url, _normalize_url(anchor["href"]))
-            if _is_http_url(href) and _is_external_non_pinterest(href):
+            if _is_external_http_url(href):
                 return href
 
     for anchor in soup.find_all(["a", "button"], href=True):
         text = _clean_ws(anchor.get_text(" ", strip=True)).lower()
-        if any(pattern in text for pattern in VISIT_SITE_PATTERNS):
+        if VISIT_SITE_PATTERN.search(text):
             href = urljoin(dest_url, _normalize_url(anchor["href"]))
-            if _is_http_url(href) and _is_external_non_pinterest(href):
+            if _is_external_http_url(href):
                 return href
 
-    canon = _extract_canonical_url(dest_html, dest_url)
-    if canon and _is_http_url(canon) and _is_external_non_pinterest(canon):
+    canon = _extract_canonical_url(dest_page, dest_url)
+    if canon and _is_external_http_url(canon):
         return canon
 
-    og_url = _extract_og_url(dest_html)
+    og_url = _extract_og_url(dest_page)
     if og_url:
         candidate = urljoin(dest_url, og_url)
-        if _is_http_url(candidate) and _is_external_non_pinterest(candidate):
+        if _is_external_http_url(candidate):
             return candidate
 
-    dest_host = urlparse(dest_url).netloc.lower()
-    for anchor in soup.find_all("a", href=True):
+    dest_host = _classify_url(dest_url).host
+    for anchor in dest_page.anchors:
         href = urljoin(dest_url, _normalize_url(anchor["href"]))
-        if not _is_http_url(href) or not _is_external_non_pinterest(href):
-            continue
-        host = urlparse(href).netloc.lower()
-        if host and host != dest_host:
+        info = _classify_url(href)
+        if info.is_http and info.is_external and info.host != dest_host:
             return href
 
     return None
@@ -806,7 +879,7 @@ def _recipe_quality_score(recipe: ImportedRecipe) -> int:
 
 def _scrape_recipe_page(
     url: str,
-    html: str,
+    page: ParsedPage,
     image_url: Optional[str],
     *,
     platform: str,
@@ -814,7 +887,7 @@ def _scrape_recipe_page(
     extracted_via_openai: str,
 ) -> ImportedRecipe:
     schema_nodes: List[dict[str, Any]] = []
-    for block in extract_json_ld_blocks(html):
+    for block in json_ld_blocks_from_soup(page.soup):
         schema_nodes.extend(find_recipe_nodes(block))
 
     best_node = pick_best_recipe(schema_nodes)
@@ -830,127 +903,174 @@ def _scrape_recipe_page(
 
     return _openai_from_page(
         url=url,
-        html=html,
+        html=page.html,
         image_url=image_url,
         platform=platform,
         extracted_via_label=extracted_via_openai,
     )
 
 
+def _scrape_website_candidate(
+    visit_url: str, fallback_image: Optional[str]
+) -> Optional[Tuple[str, ImportedRecipe, str, Optional[str]]]:
+    try:
+        visit_html = fetch_html(visit_url)
+        visit_page = ParsedPage.from_html(visit_html)
+        visit_img = _extract_og_image(visit_page) or fallback_image
+        visit_recipe = _scrape_recipe_page(
+            visit_url,
+            visit_page,
+            visit_img,
+            platform="pinterest",
+            extracted_via_schema="pinterest_website_schema",
+            extracted_via_openai="pinterest_website_openai",
+        )
+    except httpx.HTTPError as exc:
+        logger.info("Pinterest website fetch failed: %s", exc)
+        return None
+    return visit_url, visit_recipe, visit_html, visit_img
+
+
 def import_pinterest(url: str) -> Dict[str, Any]:
-    pin_html, destination_url, pin_image = _sniff_pin_destination_with_playwright(url)
-    if not pin_html:
-        pin_html = fetch_html(url)
-    if not pin_image and pin_html:
-        pin_image = extract_og_image(pin_html)
     pin_id = _extract_pin_id(url)
+    pin_html: Optional[str] = None
+    pin_page: Optional[ParsedPage] = None
+    destination_url: Optional[str] = None
+    fetch_error: Optional[httpx.HTTPError] = None
+    try:
+        pin_html = fetch_html(url)
+    except httpx.HTTPError as exc:
+        fetch_error = exc
+        logger.info("Pinterest pin fetch failed: %s", exc)
+    if pin_html is not None:
+        pin_page = ParsedPage.from_html(pin_html)
+        destination_url = _extract_destination_url(pin_page, pin_id=pin_id)
+
+    # Public pins usually carry the destination in the static HTML; the browser is the fallback.
     if not destination_url:
-        destination_url = _extract_destination_url(pin_html, pin_id=pin_id)
-    pin_recipe = _pinterest_extract_recipe(pin_html, url, pin_image)
-    pin_recipe = _enrich_pinterest_with_openai_if_needed(pin_recipe, url, pin_html, pin_image)
-    if not destination_url and pin_id:
-        destination_url = _fetch_pin_resource_url(pin_id)
+        rendered_html, destination_url = _sniff_pin_destination_with_playwright(url)
+        if rendered_html:
+            pin_html = rendered_html
+            pin_page = ParsedPage.from_html(rendered_html)
+            if not destination_url:
+                destination_url = _extract_destination_url(pin_page, pin_id=pin_id)
+    if pin_page is None:
+        raise fetch_error
+    # Read from whichever page version is kept, so the image is extracted exactly once.
+    pin_image = _extract_og_image(pin_page)
+    pin_recipe = _pinterest_extract_recipe(pin_page, url, pin_image)
+    # The OpenAI enrichment of the pin, the destination scrape and the "visit website"
+    # fetch are independent round trips, so they run at the same time.
+    dest_html: Optional[str] = None
+    visit_url: Optional[str] = None
+    candidates: List[Tuple[str, ImportedRecipe, str, Optional[str]]] = []
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        enrich_future = executor.submit(
+            _enrich_pinterest_with_openai_if_needed, pin_recipe, url, pin_html, pin_image
+        )
+        if not destination_url and pin_id:
+            destination_url = _fetch_pin_resource_url(pin_id)
+            if destination_url:
+                logger.info("Pinterest destination URL resolved via API: %s", destination_url)
         if destination_url:
-            logger.info("Pinterest destination URL resolved via API: %s", destination_url)
-    if destination_url:
-        logger.info("Pinterest destination URL resolved: %s", destination_url)
-    else:
-        logger.info("Pinterest destination URL not found for pin %s", pin_id or "unknown")
-
-    recipe: ImportedRecipe
-    if not destination_url:
-        recipe = pin_recipe
-    else:
-        destination_url = _normalize_url(destination_url)
-        try:
-            dest_html = fetch_html(destination_url)
-        except httpx.HTTPError as exc:
-            logger.info("Pinterest destination fetch failed: %s", exc)
-            destination_url = None
-            dest_html = None
-
-        if not destination_url or not dest_html:
-            recipe = pin_recipe
+            logger.info("Pinterest destination URL resolved: %s", destination_url)
+            destination_url = _normalize_url(destination_url)
+            try:
+                dest_html = fetch_html(destination_url)
+            except httpx.HTTPError as exc:
+                logger.info("Pinterest destination fetch failed: %s", exc)
+                destination_url = None
         else:
-            dest_image = extract_og_image(dest_html) or pin_image
-            visit_url = _extract_visit_website_url(dest_html, destination_url)
-
-            candidates: List[Tuple[str, ImportedRecipe, str, Optional[str]]] = []
-            dest_recipe = _scrape_recipe_page(
+            logger.info("Pinterest destination URL not found for pin %s", pin_id or "unknown")
+
+        if destination_url and dest_html:
+            dest_page = ParsedPage.from_html(dest_html)
+            dest_image = _extract_og_image(dest_page) or pin_image
+            visit_url = _extract_visit_website_url(dest_page, destination_url)
+            dest_future = executor.submit(
+                _scrape_recipe_page,
                 destination_url,
-                dest_html,
+                dest_page,
                 dest_image,
                 platform="pinterest",
                 extracted_via_schema="pinterest_destination_schema",
                 extracted_via_openai="pinterest_destination_openai",
             )
-            candidates.append((destination_url, dest_recipe, dest_html, dest_image))
-
+            visit_future = None
             if visit_url and _normalize_url(visit_url) != _normalize_url(destination_url):
-                try:
-                    visit_html = fetch_html(visit_url)
-                    visit_img = extract_og_image(visit_html) or dest_image
-                    visit_recipe = _scrape_recipe_page(
-                        visit_url,
-                        visit_html,
-                        visit_img,
-                        platform="pinterest",
-                        extracted_via_schema="pinterest_website_schema",
-                        extracted_via_openai="pinterest_website_openai",
-                    )
-                    candidates.append((visit_url, visit_recipe, visit_html, visit_img))
-                except httpx.HTTPError as exc:
-                    logger.info("Pinterest website fetch failed: %s", exc)
+                visit_future = executor.submit(_scrape_website_candidate, visit_url, dest_image)
+            # Candidates keep their destination, website, pin order regardless of which finishes first.
+            candidates.append((destination_url, dest_future.result(), dest_html, dest_image))
+            if visit_future is not None:
+                visit_candidate = visit_future.result()
+                if visit_candidate:
+                    candidates.append(visit_candidate)
+                else:
                     visit_url = None
+        pin_recipe = enrich_future.result()
+
+    recipe: ImportedRecipe
+    if not candidates:
+        recipe = pin_recipe
+    else:
+        candidates.append((url, pin_recipe, pin_html, pin_image))
 
-            candidates.append((url, pin_recipe, pin_html, pin_image))
-
-            best_url, best_recipe, best_html, best_img = sorted(
-                candidates, key=lambda item: _recipe_quality_score(item[1]), reverse=True
-            )[0]
-
-            if best_recipe.extracted_via and best_recipe.extracted_via.startswith("openai") and len(candidates) > 1:
-                primary, secondary = candidates[0], candidates[1]
-                if _recipe_quality_score(primary[1]) < _recipe_quality_score(secondary[1]):
-                    primary, secondary = secondary, primary
-                combined = _openai_from_pages(
-                    primary_url=primary[0],
-                    primary_html=primary[2],
-                    secondary_url=secondary[0],
-                    secondary_html=secondary[2],
-                    image_url=best_img,
-                    platform="pinterest",
-                    extracted_via_label="pinterest_openai_with_secondary_context",
-                )
-                if _recipe_quality_score(combined) > _recipe_quality_score(best_recipe):
-                    best_recipe = combined
-                    best_url = primary[0]
-                    best_img = best_img or combined.media_image_url
-
-            extracted_label = (
-                "pinterest_destination_schema"
-                if best_recipe.extracted_via == "pinterest_destination_schema" and best_url == destination_url
-                else "pinterest_website_schema"
-                if best_recipe.extracted_via == "pinterest_website_schema" and visit_url and best_url != destination_url
-                else "pinterest_destination_openai"
-                if best_url == destination_url
-                else "pinterest_website_openai"
+        # Each candidate is scored once; max() keeps the first of equally scored candidates.
+        scores = {id(item[1]): _recipe_quality_score(item[1]) for item in candidates}
+        best_url, best_recipe, best_html, best_img = max(candidates, key=lambda item: scores[id(item[1])])
+
+        best_schema_score = max(
+            (scores[id(item[1])] for item in candidates if item[1].extracted_via and "schema" in item[1].extracted_via),
+            default=0,
+        )
+        # A schema-extracted candidate scoring almost as well is not worth a second OpenAI round trip.
+        if (
+            best_recipe.extracted_via
+            and best_recipe.extracted_via.startswith("openai")
+            and len(candidates) > 1
+            and scores[id(best_recipe)] - best_schema_score >= SCHEMA_SCORE_MARGIN
+        ):
+            primary, secondary = candidates[0], candidates[1]
+            if scores[id(primary[1])] < scores[id(secondary[1])]:
+                primary, secondary = secondary, primary
+            combined = _openai_from_pages(
+                primary_url=primary[0],
+                primary_html=primary[2],
+                secondary_url=secondary[0],
+                secondary_html=secondary[2],
+                image_url=best_img,
+                platform="pinterest",
+                extracted_via_label="pinterest_openai_with_secondary_context",
             )
+            if _recipe_quality_score(combined) > scores[id(best_recipe)]:
+                best_recipe = combined
+                best_url = primary[0]
+                best_img = best_img or combined.media_image_url
+
+        extracted_label = (
+            "pinterest_destination_schema"
+            if best_recipe.extracted_via == "pinterest_destination_schema" and best_url == destination_url
+            else "pinterest_website_schema"
+            if best_recipe.extracted_via == "pinterest_website_schema" and visit_url and best_url != destination_url
+            else "pinterest_destination_openai"
+            if best_url == destination_url
+            else "pinterest_website_openai"
+        )
 
-            recipe = best_recipe
-            if best_url == url:
-                recipe.extracted_via = recipe.extracted_via or "pinterest_pin"
-            else:
-                recipe.extracted_via = extracted_label
-            recipe.media_image_url = best_img or pin_image or recipe.media_image_url
-            recipe.source_url = best_url
-            recipe.source_domain = ensure_domain(best_url)
-            recipe.source_platform = "pinterest"
-            recipe.metadata["destinationUrl"] = destination_url
-            recipe.metadata["destinationDomain"] = ensure_domain(destination_url)
-            if visit_url:
-                recipe.metadata["websiteUrl"] = visit_url
-                recipe.metadata["websiteDomain"] = ensure_domain(visit_url)
+        recipe = best_recipe
+        if best_url == url:
+            recipe.extracted_via = recipe.extracted_via or "pinterest_pin"
+        else:
+            recipe.extracted_via = extracted_label
+        recipe.media_image_url = best_img or pin_image or recipe.media_image_url
+        recipe.source_url = best_url
+        recipe.source_domain = ensure_domain(best_url)
+        recipe.source_platform = "pinterest"
+        recipe.metadata["destinationUrl"] = destination_url
+        recipe.metadata["destinationDomain"] = ensure_domain(destination_url)
+        if visit_url:
+            recipe.metadata["websiteUrl"] = visit_url
+            recipe.metadata["websiteDomain"] = ensure_domain(visit_url)
     recipe.source_platform = "pinterest"
     recipe.metadata["pinterestUrl"] = url
 
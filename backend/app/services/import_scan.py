@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
 import base64
+import hashlib
 import io
+import json
 import logging
 import mimetypes
+import os
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from PIL import Image, ImageOps
@@ -27,6 +34,25 @@ from .usage_utils import append_usage_event, build_usage_event, extract_openai_u
 
 logger = logging.getLogger(__name__)
 _SETTINGS = get_settings()
+# Settings are fixed for the process lifetime; read the per-page values once.
+SCAN_MAX_IMAGE_EDGE = _SETTINGS.scan_max_image_edge
+SCAN_JPEG_QUALITY = _SETTINGS.scan_jpeg_quality
+SCAN_RESPONSE_LIMITS: Dict[str, Any] = (
+    {"max_output_tokens": _SETTINGS.scan_max_output_tokens} if _SETTINGS.scan_max_output_tokens else {}
+)
+# OCR output shorter than this cannot hold a recipe; fail before paying for any model call.
+MIN_OCR_WORDS = 6
+# Base64 is JSON-safe, so the images:annotate body is assembled around the encoded bytes
+# instead of round-tripping each image through str and the JSON encoder.
+VISION_REQUEST_PREFIX = b'{"image":{"content":"'
+VISION_REQUEST_SUFFIX = b'"},"features":[{"type":"DOCUMENT_TEXT_DETECTION"}]}'
+VISION_ANNOTATE_URL: Optional[str] = (
+    f"https://vision.googleapis.com/v1/images:annotate?key={_SETTINGS.google_vision_api_key}"
+    if _SETTINGS.google_vision_api_key
+    else None
+)
+_vision_client: Optional[httpx.Client] = None
+_vision_client_lock = threading.Lock()
 
 
 class _IngredientLine(BaseModel):
@@ -72,12 +98,10 @@ def _guess_extension(filename: Optional[str], content_type: Optional[str]) -> st
     return ".jpg"
 
 
-def _save_image(data: bytes, filename: Optional[str], content_type: Optional[str]) -> Path:
+def _scan_image_path(filename: Optional[str], content_type: Optional[str]) -> Path:
     ext = _guess_extension(filename, content_type)
     target_dir = ensure_storage_path("scan", is_file=False)
-    output_path = target_dir / f"scan_{uuid.uuid4().hex[:10]}{ext}"
-    output_path.write_bytes(data)
-    return output_path
+    return target_dir / f"scan_{uuid.uuid4().hex[:10]}{ext}"
 
 
 def _preprocess_image(data: bytes) -> bytes:
@@ -85,59 +109,107 @@ def _preprocess_image(data: bytes) -> bytes:
         raise RuntimeError("Uploaded image is empty.")
     try:
         with Image.open(io.BytesIO(data)) as uploaded:
+            max_edge = SCAN_MAX_IMAGE_EDGE
+            resample_source = getattr(Image, "Resampling", Image)
+            resample = getattr(resample_source, "LANCZOS", Image.LANCZOS)
+            # Downscale before rotating: the square bound is orientation-independent, the
+            # not-yet-decoded JPEG can use draft (DCT-scaled) decoding, and the transpose
+            # then only touches the small image. No-op when the upload already fits.
+            uploaded.thumbnail((max_edge, max_edge), resample, reducing_gap=3.0)
             image = ImageOps.exif_transpose(uploaded)
-            max_edge = _SETTINGS.scan_max_image_edge
-            width, height = image.size
-            if max(width, height) > max_edge:
-                ratio = max_edge / float(max(width, height))
-                new_size = (int(width * ratio), int(height * ratio))
-                resample_source = getattr(Image, "Resampling", Image)
-                resample = getattr(resample_source, "LANCZOS", Image.LANCZOS)
-                image = image.resize(new_size, resample)
-            if image.mode not in {"RGB", "L"}:
+            if image.mode == "LA":
+                # Grayscale pages stay single-channel; OCR gains nothing from RGB.
+                image = image.convert("L")
+            elif image.mode not in {"RGB", "L"}:
                 image = image.convert("RGB")
             buffer = io.BytesIO()
-            image.save(
-                buffer,
-                format="JPEG",
-                quality=_SETTINGS.scan_jpeg_quality,
-                progressive=True,
-                optimize=True,
-            )
+            # Baseline JPEG without the optimize pass: Vision ignores progressive layout and the
+            # extra Huffman pass costs far more encode time than the few bytes it saves.
+            image.save(buffer, format="JPEG", quality=SCAN_JPEG_QUALITY)
         return buffer.getvalue()
     except Exception as exc:  # pragma: no cover - defensive
         raise RuntimeError("Failed to preprocess uploaded image.") from exc
 
 
-def _call_google_vision(image_data: bytes) -> tuple[str, Dict[str, Any]]:
-    api_key = _SETTINGS.google_vision_api_key
-    if not api_key:
+def _prepare_scan_image(entry: Dict[str, Any]) -> Optional[Tuple[bytes, Path]]:
+    image_bytes = (entry.get("bytes") or b"") if isinstance(entry.get("bytes"), (bytes, bytearray)) else b""
+    if not image_bytes:
+        return None
+    optimized = _preprocess_image(image_bytes)
+    return optimized, _scan_image_path(entry.get("filename"), "image/jpeg")
+
+
+def _get_vision_client() -> httpx.Client:
+    # Kept alive across scans so each Vision call reuses the open TLS connection.
+    global _vision_client
+    if _vision_client is None:
+        with _vision_client_lock:
+            if _vision_client is None:
+                _vision_client = httpx.Client(
+                    headers={"Content-Type": "application/json"},
+                    timeout=30.0,
+                    limits=httpx.Limits(max_keepalive_connections=4),
+                )
+                atexit.register(_vision_client.close)
+    return _vision_client
+
+
+def _scan_cache_path(images: List[bytes]) -> Path:
+    digest = hashlib.sha256()
+    for image_data in images:
+        digest.update(hashlib.sha256(image_data).digest())
+    return ensure_storage_path("scan_cache", f"{digest.hexdigest()}.json", is_file=True)
+
+
+def _load_scan_cache(path: Path) -> Optional[tuple[List[str], _ScannedRecipe]]:
+    try:
+        cached = json.loads(path.read_bytes())
+        return list(cached["raw_texts"]), _ScannedRecipe.model_validate(cached["recipe"])
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.warning("Ignoring unreadable scan cache entry %s: %s", path.name, exc)
+        return None
+
+
+def _store_scan_cache(path: Path, raw_texts: List[str], recipe: _ScannedRecipe) -> None:
+    payload = {"raw_texts": raw_texts, "recipe": recipe.model_dump(mode="json")}
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        logger.warning("Failed to write scan cache entry %s: %s", path.name, exc)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _call_google_vision(images: List[bytes]) -> tuple[List[str], Dict[str, Any]]:
+    if not VISION_ANNOTATE_URL:
         raise RuntimeError("GOOGLE_VISION_API_KEY is not configured.")
-    encoded = base64.b64encode(image_data).decode("ascii")
-    payload = {
-        "requests": [
-            {
-                "image": {"content": encoded},
-                "features": [{"type": "DOCUMENT_TEXT_DETECTION"}],
-            }
-        ]
-    }
-    url = f"https://vision.googleapis.com/v1/images:annotate?key={api_key}"
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(url, json=payload)
-        try:
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:  # pragma: no cover - network
-            raise RuntimeError(f"Google Vision request failed: {exc.response.text or exc}") from exc
-        data = response.json()
-    raw_text = data.get("responses", [{}])[0].get("fullTextAnnotation", {}).get("text") or ""
+    parts: List[bytes] = [b'{"requests":[']
+    for index, image_data in enumerate(images):
+        if index:
+            parts.append(b",")
+        parts.extend((VISION_REQUEST_PREFIX, base64.b64encode(image_data), VISION_REQUEST_SUFFIX))
+    parts.append(b"]}")
+    response = _get_vision_client().post(VISION_ANNOTATE_URL, content=b"".join(parts))
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:  # pragma: no cover - network
+        raise RuntimeError(f"Google Vision request failed: {exc.response.text or exc}") from exc
+    data = response.json()
+    responses = data.get("responses") or []
+    raw_texts: List[str] = []
+    for index in range(len(images)):
+        page = responses[index] if index < len(responses) else {}
+        raw_texts.append((page.get("fullTextAnnotation", {}).get("text") or "").strip())
     usage_event = build_usage_event(
         "google-vision",
         model="document-text-detection",
         stage="scan_vision",
-        extra={"images": 1},
+        extra={"images": len(images)},
     )
-    return raw_text.strip(), usage_event
+    return raw_texts, usage_event
 
 
 def _openai_recipe_from_text(
@@ -160,7 +232,7 @@ def _openai_recipe_from_text(
             {"role": "user", "content": f"OCR TEXT:\n{raw_text}"},
         ],
         text_format=_ScannedRecipe,
-        **({"max_output_tokens": _SETTINGS.scan_max_output_tokens} if _SETTINGS.scan_max_output_tokens else {}),
+        **SCAN_RESPONSE_LIMITS,
     )
     usage = extract_openai_usage(response)
     usage_event = build_usage_event(
@@ -175,33 +247,32 @@ def _openai_recipe_from_text(
 
 
 def _openai_recipe_with_fallback_from_text(raw_text: str) -> tuple[_ScannedRecipe, List[Dict[str, Any]]]:
+    word_count = len(raw_text.split())
+    if not word_count:
+        raise RuntimeError("Google Vision returned no text. Try a clearer photo.")
+    if word_count < MIN_OCR_WORDS:
+        raise RuntimeError("Google Vision found too little text to read a recipe. Try a clearer photo.")
     try:
         recipe, usage_event = _openai_recipe_from_text(raw_text)
         return recipe, [usage_event]
     except Exception as exc:
-        if _SETTINGS.scan_fallback_model:
+        fallback_model = _SETTINGS.scan_fallback_model
+        if fallback_model:
             logger.warning("Primary OpenAI parsing failed (%s). Trying fallback model.", exc)
             recipe, usage_event = _openai_recipe_from_text(
                 raw_text,
-                model_override=_SETTINGS.scan_fallback_model,
+                model_override=fallback_model,
             )
             return recipe, [usage_event]
         raise
 
 
 def _convert_recipe(recipe: _ScannedRecipe, image_path: Path) -> ImportedRecipe:
-    ingredients: List[ImportedIngredient] = []
-    for item in recipe.ingredients:
-        line = clean_text(f"{item.amount or ''} {item.name}".strip())
-        if not line:
-            continue
-        ingredients.append(
-            ImportedIngredient(
-                line=line,
-                amount=item.amount,
-                name=item.name,
-            )
-        )
+    ingredients: List[ImportedIngredient] = [
+        ImportedIngredient(line=line, amount=amount, name=name)
+        for amount, name in ((item.amount, item.name) for item in recipe.ingredients)
+        if (line := clean_text(f"{amount or ''} {name}".strip()))
+    ]
 
     return ImportedRecipe(
         title=recipe.title,
@@ -234,22 +305,39 @@ def import_scan(images: List[Dict[str, Optional[str]]]) -> Dict[str, Any]:
     image_paths: List[Path] = []
     raw_texts: List[str] = []
     usage_events: List[Dict[str, Any]] = []
-    for entry in images[:2]:
-        image_bytes = (entry.get("bytes") or b"") if isinstance(entry.get("bytes"), (bytes, bytearray)) else b""
-        if not image_bytes:
-            continue
-        optimized = _preprocess_image(image_bytes)
-        optimized_images.append(optimized)
-        image_paths.append(_save_image(optimized, entry.get("filename"), "image/jpeg"))
-        raw_text, usage_event = _call_google_vision(optimized)
-        raw_texts.append(raw_text)
-        usage_events.append(usage_event)
-
-    if not raw_texts:
-        raise RuntimeError("Uploaded image is empty.")
+    entries = images[:2]
+    with ThreadPoolExecutor(max_workers=len(entries)) as executor:
+        # Decoding, resizing and re-encoding release the GIL, so the pages are prepared side by side.
+        for item in executor.map(_prepare_scan_image, entries):
+            if item is None:
+                continue
+            optimized, image_path = item
+            optimized_images.append(optimized)
+            image_paths.append(image_path)
+        # The stored pages are only part of the result, so they are written while OCR runs.
+        saves = [executor.submit(path.write_bytes, data) for data, path in zip(optimized_images, image_paths)]
+
+        # Re-uploads of the same pages skip both OCR and parsing; nothing is billed on a hit.
+        cache_path = _scan_cache_path(optimized_images) if _SETTINGS.scan_cache_enabled and optimized_images else None
+        cached = _load_scan_cache(cache_path) if cache_path else None
+        if cached:
+            raw_texts, recipe = cached
+            combined_text = "\n\n".join([text for text in raw_texts if text])
+            openai_events: List[Dict[str, Any]] = []
+        else:
+            if optimized_images:
+                raw_texts, usage_event = _call_google_vision(optimized_images)
+                usage_events.append(usage_event)
 
-    combined_text = "\n\n".join([text for text in raw_texts if text])
-    recipe, openai_events = _openai_recipe_with_fallback_from_text(combined_text)
+            if not raw_texts:
+                raise RuntimeError("Uploaded image is empty.")
+
+            combined_text = "\n\n".join([text for text in raw_texts if text])
+            recipe, openai_events = _openai_recipe_with_fallback_from_text(combined_text)
+            if cache_path:
+                _store_scan_cache(cache_path, raw_texts, recipe)
+        for save in saves:
+            save.result()
     image_path = image_paths[0]
     converted = _convert_recipe(recipe, image_path)
     converted.metadata["rawText"] = combined_text
@@ -260,3 +348,8 @@ def import_scan(images: List[Dict[str, Optional[str]]]) -> Dict[str, Any]:
         append_usage_event(converted.metadata, event)
     sync_recipe_media_to_supabase(converted)
     return converted.model_dump_recipe()
+
+
+async def import_scan_async(images: List[Dict[str, Optional[str]]]) -> Dict[str, Any]:
+    # The scan pipeline blocks on PIL, disk and two remote APIs; keep it off the event loop.
+    return await asyncio.to_thread(import_scan, images)
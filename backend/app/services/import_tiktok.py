@@ -1,11 +1,10 @@
 from __future__ import annotations
 
 import json
-import re
-import shutil
 import subprocess
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
@@ -19,8 +18,10 @@ from .import_utils import (
     clean_text,
     ensure_domain,
     ensure_storage_path,
+    find_executable,
     get_openai_client,
     instructions_from_strings,
+    parse_ffmpeg_duration,
     sync_recipe_media_to_supabase,
 )
 from .usage_utils import append_usage_event, build_usage_event, extract_openai_usage
@@ -88,7 +89,7 @@ def _download_tiktok_video(tiktok_url: str) -> Path:
     file_id = uuid.uuid4().hex[:8]
     output_template = target_dir / f"tiktok_{file_id}.%(ext)s"
 
-    yt_dlp_cmd = shutil.which("yt-dlp")
+    yt_dlp_cmd = find_executable("yt-dlp")
     base_cmd = [yt_dlp_cmd] if yt_dlp_cmd else [sys.executable, "-m", "yt_dlp"]
     command = base_cmd + [
         "-f",
@@ -116,71 +117,62 @@ def _download_tiktok_video(tiktok_url: str) -> Path:
     return candidates[0]
 
 
-def _extract_audio(video_path: Path) -> Path:
-    audio_dir = ensure_storage_path("tiktok", "audio", is_file=False)
-    output_path = audio_dir / f"audio_{uuid.uuid4().hex[:8]}.mp3"
+def _extract_audio_and_thumbnail(video_path: Path) -> Tuple[bytes, Optional[float], Path]:
+    # One ffmpeg run feeds both outputs, so the video is demuxed and decoded only once.
+    # The audio is encoded straight to stdout: it is only ever uploaded, never kept on disk.
+    thumb_dir = ensure_storage_path("tiktok", "thumbnails", is_file=False)
+    thumbnail_path = thumb_dir / f"thumb_{uuid.uuid4().hex[:8]}.jpg"
     command = [
         "ffmpeg",
         "-y",
         "-i",
         str(video_path),
+        "-map",
+        "0:v:0",
+        "-ss",
+        "00:00:01.000",
+        "-vframes",
+        "1",
+        str(thumbnail_path),
+        "-map",
+        "0:a:0",
         "-vn",
+        # Lossless and nearly free to encode, unlike MP3's psychoacoustic encoder, while
+        # staying about half the size of PCM so long videos remain under Whisper's upload cap.
         "-acodec",
-        "libmp3lame",
+        "flac",
+        "-compression_level",
+        "0",
         "-ar",
         "16000",
         "-ac",
         "1",
-        str(output_path),
+        "-f",
+        "flac",
+        "pipe:1",
     ]
     try:
-        result = subprocess.run(command, capture_output=True, text=True)
+        result = subprocess.run(command, capture_output=True)
     except FileNotFoundError as exc:
         raise RuntimeError(
             "ffmpeg is required to process TikTok videos but was not found. "
             "Install ffmpeg (e.g. `brew install ffmpeg`) and restart the backend."
         ) from exc
-    if result.returncode != 0:
-        raise RuntimeError(
-            "ffmpeg failed to extract audio from the TikTok video.\n"
-            f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}"
-        )
-    return output_path
-
-
-def _capture_thumbnail(video_path: Path) -> Path:
-    thumb_dir = ensure_storage_path("tiktok", "thumbnails", is_file=False)
-    output_path = thumb_dir / f"thumb_{uuid.uuid4().hex[:8]}.jpg"
-    command = [
-        "ffmpeg",
-        "-y",
-        "-i",
-        str(video_path),
-        "-ss",
-        "00:00:01.000",
-        "-vframes",
-        "1",
-        str(output_path),
-    ]
-    try:
-        result = subprocess.run(command, capture_output=True, text=True)
-    except FileNotFoundError as exc:
-        raise RuntimeError(
-            "ffmpeg is required to capture thumbnails but was not found. "
-            "Install ffmpeg (e.g. `brew install ffmpeg`) and restart the backend."
-        ) from exc
-    if result.returncode != 0:
+    stderr = result.stderr.decode("utf-8", errors="replace")
+    if result.returncode != 0 or not result.stdout:
         raise RuntimeError(
-            "ffmpeg failed to capture a thumbnail from the TikTok video.\n"
-            f"STDOUT:\n{result.stdout}\n\nSTDERR:\n{result.stderr}"
+            "ffmpeg failed to extract audio and a thumbnail from the TikTok video.\n"
+            f"STDERR:\n{stderr}"
         )
-    return output_path
+    return result.stdout, parse_ffmpeg_duration(stderr), thumbnail_path
 
 
-def _transcribe_audio(audio_path: Path) -> str:
+def _transcribe_audio(audio: bytes) -> str:
     client = get_openai_client()
-    with audio_path.open("rb") as file_obj:
-        transcript = client.audio.transcriptions.create(model="whisper-1", file=file_obj)
+    transcript = client.audio.transcriptions.create(
+        model="whisper-1",
+        file=(f"audio_{uuid.uuid4().hex[:8]}.flac", audio),
+    )
     text = getattr(transcript, "text", None)
     if text:
         return text
@@ -189,46 +181,6 @@ def _transcribe_audio(audio_path: Path) -> str:
     return ""
 
 
-def _get_audio_duration_seconds(audio_path: Path) -> Optional[float]:
-    command = [
-        "ffprobe",
-        "-v",
-        "error",
-        "-show_entries",
-        "format=duration",
-        "-of",
-        "default=noprint_wrappers=1:nokey=1",
-        str(audio_path),
-    ]
-    try:
-        result = subprocess.run(command, capture_output=True, text=True)
-    except FileNotFoundError:
-        result = None
-    if result.returncode != 0:
-        result = None
-    if result:
-        try:
-            return float(result.stdout.strip())
-        except ValueError:
-            pass
-    # Fallback: parse ffmpeg output if ffprobe is unavailable.
-    command = ["ffmpeg", "-i", str(audio_path)]
-    try:
-        fallback = subprocess.run(command, capture_output=True, text=True)
-    except FileNotFoundError:
-        return None
-    match = re.search(r"Duration:\s(\d+):(\d+):(\d+\.?\d*)", fallback.stderr or "")
-    if not match:
-        return None
-    try:
-        hours = float(match.group(1))
-        minutes = float(match.group(2))
-        seconds = float(match.group(3))
-    except ValueError:
-        return None
-    return hours * 3600 + minutes * 60 + seconds
-
-
 def _openai_recipe_from_signals(
     tiktok_url: str,
     oembed: dict[str, Any],
@@ -282,7 +234,7 @@ def _ocr_from_image(image_path: Path) -> str:
         from PIL import Image
         import pytesseract
 
-        if not shutil.which("tesseract"):
+        if not find_executable("tesseract"):
             return ""
 
         image = Image.open(image_path).convert("L")
@@ -375,24 +327,25 @@ def _convert_recipe(
 
 
 def import_tiktok(url: str) -> Tuple[Dict[str, Any], str]:
-    oembed = _fetch_tiktok_oembed(url)
-    video_path = _download_tiktok_video(url)
-    thumbnail_path = _capture_thumbnail(video_path)
-    audio_path = _extract_audio(video_path)
-    transcript = _transcribe_audio(audio_path)
-    ocr_text = None
-    ocr_event = None
-    if len(transcript.strip()) < 120:
-        ocr_text, frames_used = _ocr_video_frames(video_path)
-        if ocr_text and frames_used > 0:
-            ocr_event = build_usage_event(
-                "local-ocr",
-                model="tesseract",
-                stage="tiktok_ocr_frames",
-                extra={"frames": frames_used, "characters": len(ocr_text)},
-            )
+    # oEmbed runs during the download and the media passes; nothing before the prompt needs it.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        oembed_future = executor.submit(_fetch_tiktok_oembed, url)
+        video_path = _download_tiktok_video(url)
+        audio, audio_seconds, thumbnail_path = _extract_audio_and_thumbnail(video_path)
+        transcript = _transcribe_audio(audio)
+        ocr_text = None
+        ocr_event = None
+        if len(transcript.strip()) < 120:
+            ocr_text, frames_used = _ocr_video_frames(video_path)
+            if ocr_text and frames_used > 0:
+                ocr_event = build_usage_event(
+                    "local-ocr",
+                    model="tesseract",
+                    stage="tiktok_ocr_frames",
+                    extra={"frames": frames_used, "characters": len(ocr_text)},
+                )
+        oembed = oembed_future.result()
     whisper_event = None
-    audio_seconds = _get_audio_duration_seconds(audio_path)
     if audio_seconds:
         whisper_event = build_usage_event(
             "openai",
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import mimetypes
+import queue
 import re
+import shutil
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Sequence
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar
 from urllib.parse import urlparse
 
 import httpx
@@ -29,10 +36,13 @@ logger.info(
 )
 
 
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
 def clean_text(value: Optional[str]) -> str:
     if not value:
         return ""
-    return re.sub(r"\s+", " ", value).strip()
+    return WHITESPACE_PATTERN.sub(" ", value).strip()
 
 
 def normalize_servings(value: Any) -> Optional[str]:
@@ -56,6 +66,7 @@ def safe_list(value: Any) -> List[Any]:
     return [value]
 
 
+@lru_cache(maxsize=1024)
 def ensure_domain(url: str) -> str:
     parsed = urlparse(url)
     return parsed.netloc or url
@@ -95,35 +106,81 @@ def normalize_iso_duration(value: Any) -> Optional[str]:
     return " ".join(components)
 
 
-def _httpx_client() -> httpx.Client:
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept-Language": "de,en;q=0.8",
-    }
-    return httpx.Client(headers=headers, timeout=30.0, follow_redirects=True)
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "de,en;q=0.8",
+}
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    # One keep-alive client per process so repeat fetches skip DNS/TCP/TLS setup;
+    # httpx.Client is safe to share across import threads.
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    headers=HTTP_HEADERS,
+                    timeout=30.0,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_keepalive_connections=20),
+                )
+                atexit.register(_http_client.close)
+    return _http_client
 
 
 def fetch_html(url: str) -> str:
-    with _httpx_client() as client:
-        response = client.get(url)
-        response.raise_for_status()
-        return response.text
+    response = get_http_client().get(url)
+    response.raise_for_status()
+    return response.text
+
+
+class _MetaPropertyFound(Exception):
+    pass
+
+
+class _MetaPropertyParser(HTMLParser):
+    """Tokenizes only until the first <meta property=...> match; no tree is built."""
+
+    def __init__(self, prop: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.prop = prop
+        self.content: Optional[str] = None
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == "meta":
+            values = dict(attrs)
+            if values.get("property") == self.prop:
+                self.content = values.get("content")
+                raise _MetaPropertyFound
+
+
+def extract_meta_property(html: str, prop: str) -> Optional[str]:
+    parser = _MetaPropertyParser(prop)
+    try:
+        parser.feed(html)
+    except _MetaPropertyFound:
+        pass
+    return parser.content or None
 
 
 def extract_og_image(html: str) -> Optional[str]:
-    soup = BeautifulSoup(html, "html.parser")
-    og = soup.find("meta", attrs={"property": "og:image"})
-    if og and og.get("content"):
-        return og["content"].strip()
-    return None
+    content = extract_meta_property(html, "og:image")
+    return content.strip() if content else None
 
 
 def extract_json_ld_blocks(html: str) -> List[Any]:
-    soup = BeautifulSoup(html, "html.parser")
+    return json_ld_blocks_from_soup(BeautifulSoup(html, "html.parser"))
+
+
+def json_ld_blocks_from_soup(soup: BeautifulSoup) -> List[Any]:
     blocks: List[Any] = []
     for script in soup.find_all("script", attrs={"type": re.compile(r"application/ld\+json", re.I)}):
         raw = script.string
@@ -289,6 +346,109 @@ def get_openai_client() -> OpenAI:
     return OpenAI(api_key=settings.openai_api_key)
 
 
+@lru_cache(maxsize=None)
+def find_executable(name: str) -> Optional[str]:
+    # PATH lookups stat every entry; the answer does not change for a running worker.
+    return shutil.which(name)
+
+
+FFMPEG_TIME_PATTERN = re.compile(r"time=(\d+):(\d+):(\d+\.?\d*)")
+FFMPEG_DURATION_PATTERN = re.compile(r"Duration:\s(\d+):(\d+):(\d+\.?\d*)")
+
+
+def parse_ffmpeg_duration(stderr: str) -> Optional[float]:
+    # The last progress "time=" is the encoded length; "Duration:" is the input's.
+    matches = FFMPEG_TIME_PATTERN.findall(stderr or "")
+    if matches:
+        hours, minutes, seconds = matches[-1]
+    else:
+        match = FFMPEG_DURATION_PATTERN.search(stderr or "")
+        if not match:
+            return None
+        hours, minutes, seconds = match.groups()
+    try:
+        return float(hours) * 3600 + float(minutes) * 60 + float(seconds)
+    except ValueError:
+        return None
+
+
+T = TypeVar("T")
+
+# Sync Playwright objects are bound to the thread that created them, so each browser slot
+# is a single-thread executor whose thread owns its own Playwright and Chromium. A few
+# slots let independent imports render in parallel; each import still gets its own context.
+PLAYWRIGHT_WORKERS = 3
+# Upper bound on waiting for a free slot plus the render itself (goto alone may take 45s).
+PLAYWRIGHT_TIMEOUT_SECONDS = 90.0
+_playwright_slots = [
+    ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"playwright-{index}")
+    for index in range(PLAYWRIGHT_WORKERS)
+]
+_free_playwright_slots: "queue.Queue[ThreadPoolExecutor]" = queue.Queue()
+for _slot in _playwright_slots:
+    _free_playwright_slots.put(_slot)
+_browser_state = threading.local()
+
+
+def _get_browser() -> Any:
+    browser = getattr(_browser_state, "browser", None)
+    if browser is not None and browser.is_connected():
+        return browser
+    from playwright.sync_api import sync_playwright
+
+    if getattr(_browser_state, "playwright", None) is None:
+        _browser_state.playwright = sync_playwright().start()
+    _browser_state.browser = _browser_state.playwright.chromium.launch(
+        headless=True,
+        args=["--no-sandbox", "--disable-dev-shm-usage"],
+    )
+    return _browser_state.browser
+
+
+def _close_browser() -> None:
+    browser = getattr(_browser_state, "browser", None)
+    playwright = getattr(_browser_state, "playwright", None)
+    if browser is not None:
+        try:
+            browser.close()
+        except Exception:
+            pass
+    if playwright is not None:
+        try:
+            playwright.stop()
+        except Exception:
+            pass
+    _browser_state.browser = None
+    _browser_state.playwright = None
+
+
+def run_with_browser(render: Callable[..., T], *args: Any, timeout: float = PLAYWRIGHT_TIMEOUT_SECONDS) -> T:
+    """Runs ``render(browser, *args)`` on a free Playwright slot with that slot's browser.
+
+    Raises ``TimeoutError`` when no slot frees up or the render does not finish within
+    ``timeout`` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        slot = _free_playwright_slots.get(timeout=timeout)
+    except queue.Empty:
+        raise TimeoutError("No Playwright browser became available in time.") from None
+    future = slot.submit(lambda: render(_get_browser(), *args))
+    # The slot is handed back only once its render has really finished, so a hung page
+    # keeps one slot busy instead of queueing later renders behind it.
+    future.add_done_callback(lambda _: _free_playwright_slots.put(slot))
+    return future.result(timeout=max(0.0, deadline - time.monotonic()))
+
+
+def shutdown_playwright() -> None:
+    closing = [slot.submit(_close_browser) for slot in _playwright_slots]
+    for future in closing:
+        try:
+            future.result(timeout=10)
+        except Exception:
+            pass
+
+
 def ensure_storage_path(*parts: str, is_file: bool = False) -> Path:
     settings = get_settings()
     target = settings.storage_dir.joinpath(*parts)
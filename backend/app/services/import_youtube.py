@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import json
 import re
-import shutil
 import subprocess
 import sys
 import uuid
@@ -19,6 +18,7 @@ from .import_utils import (
     clean_text,
     ensure_domain,
     ensure_storage_path,
+    find_executable,
     get_openai_client,
     instructions_from_strings,
 )
@@ -195,7 +195,7 @@ def _fetch_youtube_oembed(youtube_url: str) -> dict[str, Any]:
 
 
 def _yt_dlp_get_info(youtube_url: str) -> dict[str, Any]:
-    yt_dlp_cmd = shutil.which("yt-dlp")
+    yt_dlp_cmd = find_executable("yt-dlp")
     base_cmd = [yt_dlp_cmd] if yt_dlp_cmd else [sys.executable, "-m", "yt_dlp"]
     command = base_cmd + ["-J", "--no-playlist", youtube_url]
     result = subprocess.run(command, capture_output=True, text=True)
@@ -216,7 +216,7 @@ def _yt_dlp_fetch_subtitles_text(
     out_tpl = target_dir / f"subs_{file_id}.%(ext)s"
     languages = langs or ["en", "de"]
 
-    yt_dlp_cmd = shutil.which("yt-dlp")
+    yt_dlp_cmd = find_executable("yt-dlp")
     base_cmd = [yt_dlp_cmd] if yt_dlp_cmd else [sys.executable, "-m", "yt_dlp"]
 
     def run_cmd(write_auto: bool) -> Optional[Path]:
@@ -271,7 +271,7 @@ def _download_youtube_audio(youtube_url: str) -> Path:
     file_id = uuid.uuid4().hex[:8]
     out_tpl = target_dir / f"youtube_{file_id}.%(ext)s"
 
-    yt_dlp_cmd = shutil.which("yt-dlp")
+    yt_dlp_cmd = find_executable("yt-dlp")
     base_cmd = [yt_dlp_cmd] if yt_dlp_cmd else [sys.executable, "-m", "yt_dlp"]
     command = base_cmd + [
         "--no-playlist",
@@ -442,7 +442,7 @@ def _ocr_from_image_url(image_url: Optional[str]) -> tuple[str, Optional[Dict[st
         from PIL import Image
         import pytesseract
 
-        if not shutil.which("tesseract"):
+        if not find_executable("tesseract"):
             return "", None
 
         frame_dir = ensure_storage_path("youtube", "frames", is_file=False)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import insert
+
+from .database import engine
+from .models import UsageEvent
+
+logger = logging.getLogger(__name__)
+
+# A transient connection error should not drop a batch; retry it once.
+FLUSH_ATTEMPTS = 2
+
+
+class UsageEventQueue:
+    """Buffers usage_events rows and writes them in batches from a background thread.
+
+    Usage events are append-only, so losing the last partial batch on a hard crash is
+    acceptable; a graceful shutdown drains the buffer via ``stop()``.
+    """
+
+    def __init__(self, flush_interval: float = 0.05, max_batch: int = 500) -> None:
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="usage-event-flusher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        while True:
+            batch = self._drain()
+            if not batch:
+                break
+            self._flush(batch)
+
+    def put_many(self, rows: Iterable[Dict[str, Any]]) -> None:
+        rows = list(rows)
+        if not rows:
+            return
+        if not self.running:
+            # No flusher (scripts, tests): write through immediately.
+            self._flush(rows)
+            return
+        for row in rows:
+            self._queue.put(row)
+
+    def _drain(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        limit = self._max_batch if limit is None else limit
+        buffer: List[Dict[str, Any]] = []
+        while len(buffer) < limit:
+            try:
+                buffer.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return buffer
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                first = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                continue
+            self._stop.wait(self._flush_interval)
+            self._flush([first, *self._drain(self._max_batch - 1)])
+
+    def _flush(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        for attempt in range(FLUSH_ATTEMPTS):
+            try:
+                with engine.begin() as connection:
+                    connection.execute(insert(UsageEvent.__table__), rows)
+                return
+            except Exception as exc:
+                if attempt + 1 < FLUSH_ATTEMPTS:
+                    logger.warning("Retrying %s usage events after write failure: %s", len(rows), exc)
+                    time.sleep(self._flush_interval)
+                else:
+                    logger.error("Failed to write %s usage events: %s", len(rows), exc)
+
+
+usage_event_queue = UsageEventQueue()
@@ -0,0 +1,9 @@
+from app.api.routes import _normalize_text
+
+
+def test_normalize_text_keeps_umlauts():
+    assert _normalize_text("Käse-Brötchen, süß!").split() == ["käse", "brötchen", "süß"]
+
+
+def test_normalize_text_strips_punctuation():
+    assert _normalize_text("Pasta (30 min)?").split() == ["pasta", "30", "min"]
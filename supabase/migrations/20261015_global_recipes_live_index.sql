@@ -0,0 +1,3 @@
+-- Serves import_with_cache's lookup of the live (non-superseded) row for a normalized URL.
+create index if not exists ix_globalrecipe_url_live
+  on public.global_recipes (source_url_normalized, supersedes_id, updated_at);
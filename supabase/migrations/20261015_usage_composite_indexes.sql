@@ -0,0 +1,13 @@
+-- Composite indexes for the per-user lookups the API runs on every request.
+-- The unique indexes fail if duplicate (owner, period) rows already exist; merge those first.
+create unique index if not exists ix_usage_monthly_owner_period
+  on public.usage_monthly (owner_id, period_start);
+
+create unique index if not exists ix_import_usage_owner_period_source
+  on public.import_usage_monthly (owner_id, period_start, source);
+
+create index if not exists ix_shopping_user_created
+  on public.shopping_list_item (user_id, created_at);
+
+create index if not exists ix_rc_owner_created
+  on public.recipe_collections (owner_id, created_at);
@@ -0,0 +1,10 @@
+-- Usage counters and events are stamped by the database instead of the API process.
+alter table public.usage_monthly
+  alter column created_at set default timezone('utc', now()),
+  alter column updated_at set default timezone('utc', now());
+
+alter table public.import_usage_monthly
+  alter column updated_at set default timezone('utc', now());
+
+alter table public.usage_events
+  alter column created_at set default timezone('utc', now());